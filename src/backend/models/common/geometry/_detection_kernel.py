@@ -0,0 +1,42 @@
+"""
+Compiled haversine kernel for the detection sweep.
+
+The vectorized NumPy path in the detection module still materializes several
+intermediate arrays per call. This kernel fuses the whole distance
+computation into one compiled loop via Numba, with fastmath enabled and the
+result cached on disk so the JIT cost is paid once per machine, not per run.
+
+Numba is an optional accelerator: importers should fall back to the NumPy
+expression when ``haversine_nm`` is ``None``.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - exercised only without numba
+    njit = None
+
+# Mean earth radius in nautical miles (must match detection.EARTH_RADIUS_NM)
+_EARTH_RADIUS_NM = 3440.065
+
+if njit is not None:
+    # Explicit signature forces compilation at import (backed by the on-disk
+    # cache), so the first detection tick does not absorb JIT latency.
+    @njit('float64[::1](float64, float64, float64[::1], float64[::1])',
+          cache=True, fastmath=True, boundscheck=False)
+    def haversine_nm(lat0_rad, lon0_rad, lats_rad, lons_rad):  # type: ignore[misc]
+        """Distances (nm) from one observer to each (lat, lon) pair, in radians."""
+        n = lats_rad.shape[0]
+        out = np.empty(n, np.float64)
+        cos_lat0 = math.cos(lat0_rad)
+        for i in range(n):
+            sin_dlat = math.sin((lats_rad[i] - lat0_rad) * 0.5)
+            sin_dlon = math.sin((lons_rad[i] - lon0_rad) * 0.5)
+            a = sin_dlat * sin_dlat + cos_lat0 * math.cos(lats_rad[i]) * sin_dlon * sin_dlon
+            out[i] = 2.0 * _EARTH_RADIUS_NM * math.asin(math.sqrt(a))
+        return out
+else:
+    haversine_nm = None
@@ -7,58 +7,91 @@ and conversions between different angle representations.
 """
 
 import math
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Union, Optional
 
-@dataclass(frozen=True)
+# Reciprocal folded in at import so normalization multiplies instead of divides
+_INV_360 = 1.0 / 360.0
+_DEG_TO_RAD = math.pi / 180.0
+
+@dataclass(frozen=True, slots=True)
 class Bearing:
     """
     Represents a bearing/heading in degrees.
-    
+
     The bearing is always normalized to the range [0, 360).
     0° represents North, 90° East, 180° South, and 270° West.
+
+    Bearings are immutable, so the radian and signed-degree forms are
+    computed once at construction and served as plain attribute reads.
     """
     _value: float  # Internal storage, always normalized to [0, 360)
-    
+    _radians: float = field(init=False, repr=False, compare=False)
+    _signed: float = field(init=False, repr=False, compare=False)
+
     def __init__(self, degrees: float) -> None:
         """
         Create a new bearing from an angle in degrees.
-        
+
         Args:
             degrees: Angle in degrees. Will be normalized to [0, 360).
         """
         # Use object.__setattr__ since this is a frozen dataclass
-        object.__setattr__(self, '_value', self.normalize_degrees(degrees))
-    
+        d = self.normalize_degrees(degrees)
+        object.__setattr__(self, '_value', d)
+        object.__setattr__(self, '_radians', d * _DEG_TO_RAD)
+        object.__setattr__(self, '_signed', d if d <= 180 else d - 360.0)
+
     @property
     def degrees(self) -> float:
         """Get the bearing in degrees [0, 360)."""
         return self._value
-    
+
     @property
     def radians(self) -> float:
         """Get the bearing in radians [0, 2π)."""
-        return math.radians(self._value)
-    
+        return self._radians
+
     @property
     def signed_degrees(self) -> float:
         """Get the bearing in degrees [-180, 180)."""
-        value = self._value
-        if value > 180:
-            value -= 360
-        return value
+        return self._signed
     
+    @classmethod
+    def _raw(cls, degrees: float) -> 'Bearing':
+        """Build a Bearing from a value already known to be in [0, 360).
+
+        Fast constructor for internal arithmetic: skips __init__ and its
+        normalization entirely. Callers are responsible for the range.
+        """
+        b = object.__new__(cls)
+        object.__setattr__(b, '_value', degrees)
+        object.__setattr__(b, '_radians', degrees * _DEG_TO_RAD)
+        object.__setattr__(b, '_signed', degrees if degrees <= 180 else degrees - 360.0)
+        return b
+
     def __add__(self, other: Union['Bearing', float]) -> 'Bearing':
         """Add two bearings or add degrees to a bearing."""
         if isinstance(other, Bearing):
-            return Bearing(self._value + other._value)
+            # Both operands are normalized, so the sum is in [0, 720):
+            # one conditional subtract replaces the full normalization.
+            s = self._value + other._value
+            if s >= 360.0:
+                s -= 360.0
+            return Bearing._raw(s)
         return Bearing(self._value + other)
-    
+
     def __sub__(self, other: Union['Bearing', float]) -> 'Bearing':
         """Subtract two bearings or subtract degrees from a bearing."""
         if isinstance(other, Bearing):
-            return Bearing(self._value - other._value)
+            # Difference of normalized operands is in (-360, 360):
+            # one conditional add replaces the full normalization.
+            d = self._value - other._value
+            if d < 0.0:
+                d += 360.0
+            return Bearing._raw(d)
         return Bearing(self._value - other)
     
     def __eq__(self, other: object) -> bool:
@@ -76,12 +109,17 @@ class Bearing:
     @staticmethod
     def normalize_degrees(degrees: float) -> float:
         """Normalize degrees to [0, 360) range."""
-        # Faster than using modulo for small angles
-        while degrees >= 360:
-            degrees -= 360
-        while degrees < 0:
-            degrees += 360
-        return degrees
+        d = float(degrees)
+        # Fast path: most bearings are already normalized, so skip the
+        # arithmetic entirely for in-range values.
+        if 0.0 <= d < 360.0:
+            return d
+        # One multiply + floor instead of a data-dependent correction loop.
+        d = d - 360.0 * math.floor(d * _INV_360)
+        # Guard the float edge case where a tiny negative input rounds to 360.
+        if d >= 360.0:
+            d = 0.0
+        return d
     
     @staticmethod
     def from_radians(radians: float) -> 'Bearing':
@@ -102,7 +140,9 @@ class Bearing:
             - -90° is to the left (port)
             - 180° or -180° is directly behind
         """
-        # Calculate the raw difference
+        # Calculate the raw difference. Both operands are normalized, so the
+        # result needs at most one +/-360 correction; the common same-sector
+        # case falls straight through both compares with no arithmetic.
         diff = self._value - reference._value
         # Normalize to [-180, 180)
         if diff > 180:
@@ -110,10 +150,15 @@ class Bearing:
         elif diff <= -180:
             diff += 360
         return diff
-    
+
     def reciprocal(self) -> 'Bearing':
         """Get the reciprocal (opposite) bearing."""
-        return Bearing(self._value + 180)
+        # value + 180 is in [180, 540): one conditional subtract suffices,
+        # so skip the normalizing constructor.
+        d = self._value + 180.0
+        if d >= 360.0:
+            d -= 360.0
+        return Bearing._raw(d)
 
 class CardinalDirection(Enum):
     """Cardinal and intercardinal directions."""
@@ -129,20 +174,9 @@ class CardinalDirection(Enum):
     @staticmethod
     def from_bearing(bearing: Bearing) -> 'CardinalDirection':
         """Convert a bearing to the nearest cardinal/intercardinal direction."""
-        # Normalize to [0, 360) and add 22.5° to center on sectors
-        sector = (bearing.degrees + 22.5) % 360
-        # Integer divide by 45° to get sector number (0-7)
-        sector_num = int(sector / 45)
-        return [
-            CardinalDirection.N,
-            CardinalDirection.NE,
-            CardinalDirection.E,
-            CardinalDirection.SE,
-            CardinalDirection.S,
-            CardinalDirection.SW,
-            CardinalDirection.W,
-            CardinalDirection.NW
-        ][sector_num]
+        # Offset by 22.5° to center sectors, divide into 45° buckets and mask
+        # with & 7 so the 360° wrap folds back to sector 0 without a branch.
+        return _SECTORS[int((bearing.degrees + 22.5) // 45) & 7]
     
     def to_bearing(self) -> Bearing:
         """Convert cardinal direction to its corresponding bearing."""
@@ -150,7 +184,26 @@ class CardinalDirection(Enum):
     
     def __str__(self) -> str:
         """Return the cardinal direction's name."""
-        return self.name
+        # Interned table lookup: enum .name goes through a DynamicClassAttribute
+        # descriptor on every call, the dict hit does not.
+        return _CARDINAL_STR[self]
+
+# Interned direction names, built once at import for allocation-free str()
+_CARDINAL_STR = {d: sys.intern(d.name) for d in CardinalDirection}
+
+# Sector lookup table for from_bearing, indexed by 45° bucket starting at
+# north. Built once at import; defined here because the enum members do not
+# exist until the class body has executed.
+_SECTORS = (
+    CardinalDirection.N,
+    CardinalDirection.NE,
+    CardinalDirection.E,
+    CardinalDirection.SE,
+    CardinalDirection.S,
+    CardinalDirection.SW,
+    CardinalDirection.W,
+    CardinalDirection.NW,
+)
 
 # Common bearings
 NORTH = Bearing(0)
@@ -0,0 +1,105 @@
+"""
+GPU-offloaded haversine distance matrices for mission-planning sweeps.
+
+The scalar and batch paths in `haversine.py` cover per-pair queries; this
+module handles the N x M case (every unit against every waypoint), where
+each output cell is independent and the work is embarrassingly parallel.
+On machines with a CUDA device the kernel assigns one thread per (i, j)
+pair; everywhere else `haversine_matrix` falls back to one broadcasted
+call into the CPU batch implementation, so callers never need to know
+which path ran.
+"""
+
+import math
+from typing import Sequence
+
+import numpy as np
+
+try:
+    from numba import cuda
+except ImportError:  # pragma: no cover - exercised only without numba
+    cuda = None
+
+from .haversine import EARTH_RADIUS_NM, calculate_haversine_distance_batch
+from .position import Position
+
+# Below this output size the host<->device transfer dominates the compute,
+# so small sweeps stay on the CPU even when a device is present.
+_GPU_MIN_CELLS = 512 * 512
+
+if cuda is not None:
+    @cuda.jit
+    def _hv_kernel(lat1, lon1, lat2, lon2, inv_scale, out):  # type: ignore[misc]
+        """One thread per (i, j): great-circle nm from src i to dst j."""
+        i, j = cuda.grid(2)
+        if i < lat1.shape[0] and j < lat2.shape[0]:
+            a1 = math.pi / 180.0 * (lat1[i] * inv_scale)
+            b1 = math.pi / 180.0 * (lon1[i] * inv_scale)
+            a2 = math.pi / 180.0 * (lat2[j] * inv_scale)
+            b2 = math.pi / 180.0 * (lon2[j] * inv_scale)
+            sin_dlat = math.sin((a2 - a1) * 0.5)
+            sin_dlon = math.sin((b2 - b1) * 0.5)
+            a = sin_dlat * sin_dlat + math.cos(a1) * math.cos(a2) * sin_dlon * sin_dlon
+            out[i, j] = 2.0 * EARTH_RADIUS_NM * math.asin(math.sqrt(a))
+
+
+def _gpu_available() -> bool:
+    """True when a usable CUDA device is present."""
+    if cuda is None:
+        return False
+    try:
+        return bool(cuda.is_available())
+    except Exception:  # pragma: no cover - driver probing can itself fail
+        return False
+
+
+def haversine_matrix(
+    src_positions: Sequence[Position],
+    dst_positions: Sequence[Position],
+    scale_factor: float = 1.0,
+) -> np.ndarray:
+    """
+    Compute the full N x M great-circle distance matrix in nautical miles.
+
+    Dispatches to the CUDA kernel for large sweeps when a device exists;
+    otherwise evaluates one broadcasted CPU batch call. Both paths share
+    the spherical model, so results agree to floating-point noise.
+
+    Args:
+        src_positions: Row positions (e.g. units)
+        dst_positions: Column positions (e.g. waypoints)
+        scale_factor: Scale factor converting game coordinates to degrees
+
+    Returns:
+        Array of shape (len(src_positions), len(dst_positions))
+    """
+    src_lat = np.array([p.y for p in src_positions], dtype=np.float64)
+    src_lon = np.array([p.x for p in src_positions], dtype=np.float64)
+    dst_lat = np.array([p.y for p in dst_positions], dtype=np.float64)
+    dst_lon = np.array([p.x for p in dst_positions], dtype=np.float64)
+
+    n, m = src_lat.shape[0], dst_lat.shape[0]
+    if n * m >= _GPU_MIN_CELLS and _gpu_available():
+        out = cuda.device_array((n, m), dtype=np.float64)
+        threads = (16, 16)
+        blocks = (
+            (n + threads[0] - 1) // threads[0],
+            (m + threads[1] - 1) // threads[1],
+        )
+        _hv_kernel[blocks, threads](
+            cuda.to_device(src_lat),
+            cuda.to_device(src_lon),
+            cuda.to_device(dst_lat),
+            cuda.to_device(dst_lon),
+            1.0 / scale_factor,
+            out,
+        )
+        return np.asarray(out.copy_to_host())
+
+    return calculate_haversine_distance_batch(
+        src_lat[:, None],
+        src_lon[:, None],
+        dst_lat[None, :],
+        dst_lon[None, :],
+        scale_factor,
+    )
@@ -8,6 +8,13 @@ between different units of measurement commonly used in naval operations.
 from dataclasses import dataclass
 from typing import Union, ClassVar
 
+# Module-level conversion constants for callers that work in raw floats and
+# only wrap in NauticalMiles at API boundaries (hot paths skip the class
+# attribute walk entirely).
+METERS_PER_NMILE = 1852.0
+STATUTE_MILES_PER_NMILE = 1.15078
+KILOMETERS_PER_NMILE = METERS_PER_NMILE / 1000.0
+
 @dataclass(frozen=True)
 class NauticalMiles:
     """
@@ -22,10 +29,15 @@ class NauticalMiles:
     1 nautical mile = 1/60th of a degree of latitude
     """
     
-    # Standard conversion factors as class constants
-    METERS_PER_NMILE: ClassVar[float] = 1852.0
-    STATUTE_MILES_PER_NMILE: ClassVar[float] = 1.15078
-    KILOMETERS_PER_NMILE: ClassVar[float] = METERS_PER_NMILE / 1000.0
+    # Standard conversion factors, aliased from the module constants
+    METERS_PER_NMILE: ClassVar[float] = METERS_PER_NMILE
+    STATUTE_MILES_PER_NMILE: ClassVar[float] = STATUTE_MILES_PER_NMILE
+    KILOMETERS_PER_NMILE: ClassVar[float] = KILOMETERS_PER_NMILE
+
+    # Shared zero-distance flyweight, assigned after the class body below.
+    # Instances are immutable, so hot paths (stopping a unit every tick)
+    # can reuse this instead of re-running construction and validation.
+    ZERO: ClassVar["NauticalMiles"]
     
     # Distance in nautical miles (1 NM = 1852 meters)
     _distance_nm: float
@@ -98,15 +110,15 @@ class NauticalMiles:
     
     def to_meters(self) -> float:
         """Convert to meters."""
-        return self._distance_nm * self.METERS_PER_NMILE
+        return self._distance_nm * METERS_PER_NMILE
     
     def to_kilometers(self) -> float:
         """Convert to kilometers."""
-        return self._distance_nm * self.KILOMETERS_PER_NMILE
+        return self._distance_nm * KILOMETERS_PER_NMILE
     
     def to_statute_miles(self) -> float:
         """Convert to statute miles."""
-        return self._distance_nm * self.STATUTE_MILES_PER_NMILE
+        return self._distance_nm * STATUTE_MILES_PER_NMILE
     
     def __add__(self, other: "NauticalMiles") -> "NauticalMiles":
         """Add two NauticalMiles values."""
@@ -158,4 +170,6 @@ class NauticalMiles:
     
     def __repr__(self) -> str:
         """Return detailed string representation."""
-        return f"NauticalMiles({self._distance_nm})" 
\ No newline at end of file
+        return f"NauticalMiles({self._distance_nm})"
+
+NauticalMiles.ZERO = NauticalMiles(0.0) 
\ No newline at end of file
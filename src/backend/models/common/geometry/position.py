@@ -16,16 +16,20 @@ Note: Pure geometric calculations (like distance) will be moved to a separate
 geometric calculations module to maintain single responsibility principle.
 """
 
+import math
 from dataclasses import dataclass
-from typing import Tuple, Dict, Mapping
+from typing import Callable, Tuple, Dict, Mapping
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Position:
     """
     Represents an immutable position in 2D space.
     
     This class is frozen (immutable) to prevent accidental modifications
-    and to allow it to be used as a dictionary key or in sets.
+    and to allow it to be used as a dictionary key or in sets. It is also
+    slotted: x/y reads are C-level slot loads and instances carry no
+    per-object dict, which matters when every unit holds positions that
+    are rebuilt each movement tick.
     
     Attributes:
         x: The x-coordinate in game space
@@ -46,7 +50,7 @@ class Position:
         """
         return {"x": float(self.x), "y": float(self.y)}
     
-    def distance_to(self, other: 'Position') -> float:
+    def distance_to(self, other: 'Position', _hypot: Callable[[float, float], float] = math.hypot) -> float:
         """
         Calculate Euclidean distance to another position.
         
@@ -59,7 +63,19 @@ class Position:
         Returns:
             float: The Euclidean distance between the positions
         """
-        return ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
+        # math.hypot is a single C call and avoids the overflow/underflow
+        # issues of the naive sqrt(dx**2 + dy**2) form; the default-arg
+        # binding makes it a LOAD_FAST instead of a global+attribute lookup.
+        return _hypot(self.x - other.x, self.y - other.y)
+
+    def translate(self, dx: float, dy: float) -> 'Position':
+        """Return this position shifted by (dx, dy).
+
+        Positions stay immutable on purpose: after arrival snapping, a
+        unit's position and destination can alias the same instance, so an
+        in-place add would silently move the destination too.
+        """
+        return Position(self.x + dx, self.y + dy)
 
     @classmethod
     def from_tuple(cls, coords: Tuple[float, float]) -> 'Position':
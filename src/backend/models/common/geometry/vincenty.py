@@ -6,6 +6,7 @@ surface using Vincenty's formulae. Each calculation is broken down into atomic f
 for better testing and debugging capabilities.
 """
 
+import functools
 import math
 from dataclasses import dataclass
 from typing import Optional, Tuple, NamedTuple
@@ -27,7 +28,7 @@ class VincentyResult(NamedTuple):
     initial_bearing: Bearing  # Initial bearing
     final_bearing: Bearing   # Final bearing
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeoPosition:
     """
     Represents an immutable geographic position using latitude and longitude.
@@ -82,21 +83,25 @@ def normalize_radians(angle_rad: float) -> float:
         angle_rad += 2 * math.pi
     return angle_rad
 
-def degrees_to_radians(degrees: float) -> float:
-    """Convert degrees to radians."""
-    return math.radians(degrees)
-
-def radians_to_degrees(radians: float) -> float:
-    """Convert radians to degrees."""
-    return math.degrees(radians)
+# Degree/radian conversion, bound straight to the C implementations: the
+# previous def wrappers added a Python frame per call for callers on the
+# Vincenty path (the solver itself already calls math.radians directly).
+degrees_to_radians = math.radians
+radians_to_degrees = math.degrees
 
 def normalize_degrees(degrees: float) -> float:
     """Normalize degrees to 0-360 range."""
     return (degrees + 360.0) % 360.0
 
 # --- Coordinate transformations ---
+@functools.lru_cache(maxsize=1024)
 def calculate_reduced_latitude(lat_rad: float) -> ReducedLatitude:
-    """Calculate reduced latitude (latitude on auxiliary sphere)."""
+    """Calculate reduced latitude (latitude on auxiliary sphere).
+
+    Memoized: the result tuple is immutable and callers (the Vincenty
+    solver, sweeps over unit sets) keep hitting the same latitudes, so
+    repeats become a dict lookup instead of atan/sin/cos calls.
+    """
     sin_lat = math.sin(lat_rad)
     cos_lat = math.cos(lat_rad)
     
@@ -257,11 +262,17 @@ def calculate_vincenty_full(pos1: GeoPosition, pos2: GeoPosition) -> VincentyRes
     L = lon2 - lon1
     lambda_old = normalize_radians(L)
     
+    # Bind the trig functions once: the iteration below is the only hot
+    # loop in this module and the locals skip a module attribute lookup
+    # per call. sigma/alpha components are already derived algebraically
+    # (sqrt/atan2), so lambda is the only angle needing sin and cos here.
+    sin, cos = math.sin, math.cos
+    
     # Step 4: Iterate to convergence
     for iteration in range(100):
         # Step 4a: Calculate lambda components
-        sin_lambda = math.sin(lambda_old)
-        cos_lambda = math.cos(lambda_old)
+        sin_lambda = sin(lambda_old)
+        cos_lambda = cos(lambda_old)
         
         # Step 4b: Calculate sigma components
         sin_sigma, cos_sigma, sigma = calculate_sigma_components(
@@ -315,6 +326,21 @@ def calculate_vincenty_full(pos1: GeoPosition, pos2: GeoPosition) -> VincentyRes
     
     raise ValueError("Vincenty formula failed to converge")
 
+@functools.lru_cache(maxsize=256)
+def _vincenty_core(lat1: float, lon1: float, lat2: float, lon2: float) -> VincentyResult:
+    """Run the full solver for degree coordinates, memoizing the result.
+
+    The iterative lambda/sigma loop is the expensive part of every public
+    entry point, and repeated queries between the same endpoints (distance
+    then bearing, symmetric checks, overlapping sweeps) are common. The
+    result tuple is immutable, so caching on the raw coordinates is safe
+    and collapses repeats to a dict lookup.
+    """
+    return calculate_vincenty_full(
+        GeoPosition(latitude=lat1, longitude=lon1),
+        GeoPosition(latitude=lat2, longitude=lon2),
+    )
+
 def calculate_vincenty_distance(pos1: Position, pos2: Position, scale_factor: float = 1.0) -> NauticalMiles:
     """
     Calculate the distance between two game positions using Vincenty's formulae.
@@ -327,9 +353,10 @@ def calculate_vincenty_distance(pos1: Position, pos2: Position, scale_factor: fl
     Returns:
         Distance in nautical miles
     """
-    geo_pos1 = GeoPosition.from_position(pos1, scale_factor)
-    geo_pos2 = GeoPosition.from_position(pos2, scale_factor)
-    result = calculate_vincenty_full(geo_pos1, geo_pos2)
+    result = _vincenty_core(
+        pos1.y / scale_factor, pos1.x / scale_factor,
+        pos2.y / scale_factor, pos2.x / scale_factor,
+    )
     return result.distance
 
 def calculate_haversine_distance(pos1: Position, pos2: Position, scale_factor: float = 1.0) -> NauticalMiles:
@@ -358,7 +385,8 @@ def bearing_between(pos1: Position, pos2: Position, scale_factor: float = 1.0) -
     Returns:
         Initial bearing in degrees
     """
-    geo_pos1 = GeoPosition.from_position(pos1, scale_factor)
-    geo_pos2 = GeoPosition.from_position(pos2, scale_factor)
-    result = calculate_vincenty_full(geo_pos1, geo_pos2)
+    result = _vincenty_core(
+        pos1.y / scale_factor, pos1.x / scale_factor,
+        pos2.y / scale_factor, pos2.x / scale_factor,
+    )
     return result.initial_bearing 
\ No newline at end of file
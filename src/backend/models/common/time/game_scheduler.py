@@ -8,6 +8,7 @@ It runs game ticks in a separate thread.
 from typing import Optional, Callable
 from threading import Thread, Event
 import inspect
+import time
 from dataclasses import dataclass, field
 
 @dataclass
@@ -26,7 +27,8 @@ class GameScheduler:
     _tick_handler: Optional[Callable[[], None]] = field(default=None, init=False)
     _scheduler_thread: Optional[Thread] = field(default=None, init=False)
     _stop_event: Event = field(default_factory=Event, init=False)
-    
+    _worker_joined: Event = field(default_factory=Event, init=False)  # Set when the loop exits
+
     def start(self, tick_handler: Callable[[], None]) -> None:
         """
         Start the scheduler with the given tick handler.
@@ -42,15 +44,22 @@ class GameScheduler:
         if self._scheduler_thread is not None and self._scheduler_thread.is_alive():
             raise RuntimeError("Scheduler is already running")
             
-        # Validate handler signature
+        # Validate handler signature once here so the tick loop can call the
+        # handler directly with no per-tick checks. Parameters with defaults
+        # (and *args/**kwargs) are fine; only required ones are rejected.
         sig = inspect.signature(tick_handler)
-        if len(sig.parameters) != 0:
+        if any(
+            p.default is p.empty
+            and p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+            for p in sig.parameters.values()
+        ):
             raise TypeError(
                 f"Tick handler must take no arguments. Got: {sig}"
             )
             
         self._tick_handler = tick_handler
         self._stop_event.clear()
+        self._worker_joined.clear()
         
         self._scheduler_thread = Thread(
             target=self._scheduler_loop,
@@ -71,16 +80,41 @@ class GameScheduler:
         self._tick_handler = None
     
     def _scheduler_loop(self) -> None:
-        """Main scheduler loop that triggers ticks."""
-        if self._tick_handler is None:
+        """Main scheduler loop that triggers ticks.
+
+        Ticks are paced against monotonic deadlines rather than a fixed sleep
+        after each handler call, so handler execution time does not stretch
+        the period and drift does not compound across ticks.
+        """
+        handler = self._tick_handler
+        if handler is None:
+            self._worker_joined.set()
             return
-            
-        while not self._stop_event.is_set():
-            try:
-                self._tick_handler()
-            except Exception:
-                pass
-            Event().wait(self.tick_delay)
+
+        try:
+            deadline = time.monotonic() + self.tick_delay
+            while not self._stop_event.is_set():
+                try:
+                    handler()
+                except Exception:
+                    pass
+                # Waiting on the stop event doubles as an interruptible sleep,
+                # so stop() wakes the loop immediately. Skip the wait entirely
+                # when the deadline has already passed: Event.wait(0) still takes
+                # the condition-variable lock and forces an extra context switch.
+                now = time.monotonic()
+                remaining = deadline - now
+                if remaining > 0.0:
+                    self._stop_event.wait(remaining)
+                deadline += self.tick_delay
+                if deadline < now:
+                    # Handler overran at least one full period; rebase rather
+                    # than firing a burst of catch-up ticks.
+                    deadline = now + self.tick_delay
+        finally:
+            # Deterministic signal for tests/observers that no further tick
+            # can fire, without having to sleep "long enough".
+            self._worker_joined.set()
     
     @property
     def is_running(self) -> bool:
@@ -15,11 +15,28 @@ The game time system supports:
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from time import time_ns
 from typing import Union, Optional, ClassVar, Dict, Any
 from threading import Lock
 from .time_zone import GameTimeZone
 from .time_interface import TimeInterface
 
+# Integer-nanosecond backing for GameTime: epoch reference and conversions.
+# Conversions go through timedelta components so they are exact, with no
+# float rounding on historical (negative-timestamp) dates.
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NS_PER_SECOND = 1_000_000_000
+
+def _datetime_to_ns(dt: datetime) -> int:
+    """Convert an aware datetime to integer UTC epoch nanoseconds."""
+    delta = dt - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * _NS_PER_SECOND + delta.microseconds * 1000
+
+# Lower game-time bound as a module-level int64, so the hot bounds check is
+# a plain global load rather than a class-attribute walk. The upper bound is
+# "now" and has to stay dynamic (time_ns()).
+_GAME_START_NS = _datetime_to_ns(datetime(1900, 1, 1, tzinfo=timezone.utc))
+
 def authorized_caller_only(func):
     """Decorator to restrict method access to authorized modules only."""
     def wrapper(self, *args, **kwargs):
@@ -31,7 +48,7 @@ def authorized_caller_only(func):
         return func(self, *args, **kwargs)
     return wrapper
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameDuration:
     """
     Represents a duration of game time.
@@ -86,7 +103,9 @@ class GameDuration:
             - GameDuration when dividing by a number
             - float when dividing by another GameDuration
         """
-        if isinstance(divisor, GameDuration):
+        # Exact-type check first: it is the common case and cheaper than
+        # isinstance, which walks the MRO. GameDuration is not subclassed.
+        if type(divisor) is GameDuration:
             return self._seconds / divisor._seconds
         return GameDuration(self._seconds / divisor)
     
@@ -132,7 +151,6 @@ class GameDuration:
         """Create duration from days."""
         return cls(days * 86400)
 
-@dataclass
 class GameTime(TimeInterface):
     """
     Represents a specific point in game time.
@@ -143,31 +161,65 @@ class GameTime(TimeInterface):
     
     The game time is always validated to ensure it falls within
     the valid game time range (between GAME_START and current UTC time).
+
+    Internally the instant is an integer count of UTC epoch nanoseconds,
+    so arithmetic and comparisons are single integer operations with no
+    datetime/timedelta allocation; the datetime form is materialized
+    lazily and cached for formatting and conversion.
     """
     # Historical reference points as datetime objects
     GAME_START: ClassVar[datetime] = datetime(1900, 1, 1, tzinfo=timezone.utc)
     PEARL_HARBOR_ATTACK: ClassVar[datetime] = datetime(1941, 12, 7, 17, 48, tzinfo=timezone.utc)
-    
-    # The actual datetime object must come before optional fields
-    _time: datetime
-    _time_zone: Optional[GameTimeZone] = None
-    
-    def __post_init__(self) -> None:
-        """Validate the time is within game bounds."""
-        if self._time.tzinfo is None:
+
+    _GAME_START_NS: ClassVar[int] = _GAME_START_NS
+
+    __slots__ = ('_ns', '_time_zone', '_dt', '_dt_local')
+
+    def __init__(self, _time: datetime, _time_zone: Optional[GameTimeZone] = None) -> None:
+        """Create a game time from an aware datetime, validating game bounds."""
+        if _time.tzinfo is None:
             raise ValueError("Game time must have timezone information")
-            
-        # Convert all times to UTC for comparison
-        game_time_utc = self._time.astimezone(timezone.utc)
-        current_utc = datetime.now(timezone.utc)
-            
-        # Compare using UTC datetimes to avoid recursion
-        if not (self.GAME_START <= game_time_utc <= current_utc):
+        ns = _datetime_to_ns(_time)
+        self._check_bounds(ns)
+        self._ns = ns
+        self._time_zone = _time_zone
+        self._dt: Optional[datetime] = _time
+        self._dt_local: Optional[datetime] = None
+
+    @classmethod
+    def _check_bounds(cls, ns: int) -> None:
+        """Reject instants outside [GAME_START, now]; integer compares only.
+
+        Either delta going negative means out of range, and ORing them folds
+        both sign tests into one compare-and-branch on the hot valid path.
+        """
+        if (ns - _GAME_START_NS) | (time_ns() - ns) < 0:
+            current_utc = datetime.now(timezone.utc)
             raise ValueError(
-                f"Game time must be between {self.GAME_START.isoformat()} "
+                f"Game time must be between {cls.GAME_START.isoformat()} "
                 f"and {current_utc.isoformat()}"
             )
-    
+
+    @classmethod
+    def _from_ns(cls, ns: int, time_zone: Optional[GameTimeZone]) -> 'GameTime':
+        """Build from epoch nanoseconds (arithmetic fast path, still bounded)."""
+        cls._check_bounds(ns)
+        t = object.__new__(cls)
+        t._ns = ns
+        t._time_zone = time_zone
+        t._dt = None
+        t._dt_local = None
+        return t
+
+    def _raw_datetime(self) -> datetime:
+        """The cached datetime form in its original/UTC representation."""
+        dt = self._dt
+        if dt is None:
+            # Exact for the microsecond resolution datetime carries
+            dt = _EPOCH + timedelta(microseconds=self._ns // 1000)
+            self._dt = dt
+        return dt
+
     @property
     def time_zone(self) -> Optional[GameTimeZone]:
         """Get the time zone, if any."""
@@ -175,18 +227,27 @@ class GameTime(TimeInterface):
     
     def in_zone(self, zone: GameTimeZone) -> 'GameTime':
         """Get this time in a different time zone."""
-        return GameTime(self._time, zone)
+        return GameTime(self._raw_datetime(), zone)
     
     def to_datetime(self) -> datetime:
-        """Get the underlying datetime object."""
-        if self._time_zone is not None:
-            return self._time.astimezone(self._time_zone.to_timezone())
-        return self._time
+        """Get the underlying datetime object.
+
+        Cached per instance (the class is immutable), so rendering code that
+        reads .hour/.minute/.second back-to-back converts once, not per call.
+        """
+        if self._time_zone is None:
+            return self._raw_datetime()
+        dt = self._dt_local
+        if dt is None:
+            dt = self._raw_datetime().astimezone(self._time_zone.to_timezone())
+            self._dt_local = dt
+        return dt
     
     def __add__(self, other: GameDuration) -> 'GameTime':
         """Add a duration to this time."""
-        new_time = self._time + timedelta(seconds=other.seconds)
-        return GameTime(new_time, self._time_zone)
+        return GameTime._from_ns(
+            self._ns + int(other.seconds * _NS_PER_SECOND), self._time_zone
+        )
     
     def __sub__(self, other: Union[GameDuration, 'GameTime']) -> Union['GameTime', GameDuration]:
         """
@@ -197,34 +258,34 @@ class GameTime(TimeInterface):
             - GameDuration when subtracting another GameTime
         """
         if isinstance(other, GameDuration):
-            new_time = self._time - timedelta(seconds=other.seconds)
-            return GameTime(new_time, self._time_zone)
+            return GameTime._from_ns(
+                self._ns - int(other.seconds * _NS_PER_SECOND), self._time_zone
+            )
         
         # When subtracting two GameTimes, return the duration between them
-        delta = self._time - other._time
-        return GameDuration(delta.total_seconds())
+        return GameDuration((self._ns - other._ns) / _NS_PER_SECOND)
     
     def __lt__(self, other: 'GameTime') -> bool:
         """Compare if this time is earlier than another."""
-        return self._time < other._time
+        return self._ns < other._ns
     
     def __le__(self, other: 'GameTime') -> bool:
         """Compare if this time is earlier than or equal to another."""
-        return self._time <= other._time
+        return self._ns <= other._ns
     
     def __gt__(self, other: 'GameTime') -> bool:
         """Compare if this time is later than another."""
-        return self._time > other._time
+        return self._ns > other._ns
     
     def __ge__(self, other: 'GameTime') -> bool:
         """Compare if this time is later than or equal to another."""
-        return self._time >= other._time
+        return self._ns >= other._ns
     
     def __eq__(self, other: object) -> bool:
         """Compare if two times are equal."""
         if not isinstance(other, GameTime):
             return NotImplemented
-        return self._time == other._time
+        return self._ns == other._ns
     
     @classmethod
     def from_datetime(cls, dt: datetime, time_zone: Optional[GameTimeZone] = None) -> 'GameTime':
@@ -255,11 +316,11 @@ class GameTime(TimeInterface):
     
     def strftime(self, format: str) -> str:
         """Format time according to format string."""
-        return self._time.strftime(format)
+        return self._raw_datetime().strftime(format)
     
     def __str__(self) -> str:
         """Convert to string using ISO format."""
-        return self._time.isoformat()
+        return self._raw_datetime().isoformat()
     
     @classmethod
     def default_start_time(cls) -> 'GameTime':
@@ -270,7 +331,7 @@ class GameTime(TimeInterface):
     def get_time_state(self):
         """Get the current time state - restricted access method."""
         return {
-            'current_time': self._time.isoformat(),
+            'current_time': self._raw_datetime().isoformat(),
             'time_zone': self._time_zone.name if self._time_zone else None
         }
 
@@ -308,6 +369,16 @@ class GameTimeManager:
         """Get the current game time."""
         with self._lock:
             return self._current_time
+
+    def reset_to(self, start_time: GameTime) -> None:
+        """
+        Reset the clock to a specific instant.
+
+        Used for scenario restarts and by tests that share one manager
+        instead of constructing a fresh one per case.
+        """
+        with self._lock:
+            self._current_time = start_time
     
     def advance_time(self, duration: GameDuration) -> GameTime:
         """
@@ -323,5 +394,10 @@ class GameTimeManager:
             ValueError: If advancing time would exceed game bounds
         """
         with self._lock:
-            self._current_time = self._current_time + duration
+            # Trusted-producer fast path: the current time is already
+            # validated, so build the result via _from_ns directly (one int
+            # add plus the range check) instead of operator dispatch.
+            current = self._current_time
+            new_ns = current._ns + int(duration.seconds * _NS_PER_SECOND)
+            self._current_time = GameTime._from_ns(new_ns, current._time_zone)
             return self._current_time 
\ No newline at end of file
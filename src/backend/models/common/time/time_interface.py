@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 
 class TimeInterface(ABC):
+    __slots__ = ()  # Keep slotted subclasses free of per-instance dicts
+
     @abstractmethod
     def get_time_state(self):
         '''Abstract method to get the time state. Must be implemented by subclasses.'''
@@ -6,10 +6,21 @@ regions to have their own local time. It supports both fixed offsets
 and named time zones.
 """
 
+import functools
 from dataclasses import dataclass
 from datetime import timezone, timedelta
 from typing import Union, Optional
 
+@functools.lru_cache(maxsize=64)
+def _tz_from_hours(hours: float, name: Optional[str]) -> 'GameTimeZone':
+    """Cached GameTimeZone construction keyed by (hours, name)."""
+    return GameTimeZone(hours, name)
+
+@functools.lru_cache(maxsize=64)
+def _stdlib_timezone(offset_hours: float) -> timezone:
+    """Cached stdlib timezone for a fixed hour offset."""
+    return timezone(timedelta(hours=offset_hours))
+
 @dataclass(frozen=True)
 class GameTimeZone:
     """
@@ -36,8 +47,8 @@ class GameTimeZone:
         return self._name
     
     def to_timezone(self) -> timezone:
-        """Convert to Python timezone."""
-        return timezone(timedelta(hours=self._offset_hours))
+        """Convert to Python timezone (cached; zones repeat across units)."""
+        return _stdlib_timezone(self._offset_hours)
     
     def __str__(self) -> str:
         """Convert to string."""
@@ -54,8 +65,12 @@ class GameTimeZone:
     
     @classmethod
     def from_hours(cls, hours: float, name: Optional[str] = None) -> 'GameTimeZone':
-        """Create time zone from hours offset."""
-        return cls(hours, name)
+        """Create time zone from hours offset.
+
+        Instances are immutable, so repeat requests for the same offset
+        share one cached object instead of allocating per call.
+        """
+        return _tz_from_hours(hours, name)
 
 # Common time zones
 UTC = GameTimeZone.utc()
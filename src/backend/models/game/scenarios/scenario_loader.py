@@ -11,6 +11,7 @@ systems/tests can wire the plumbing without committing to a format.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -18,6 +19,27 @@ from typing import Optional
 DEFAULT_SCENARIO_DIR = Path("assets/scenarios")
 
 
+@lru_cache(maxsize=32)
+def _load_raw_cached(base_dir: Path, name: str, ext: Optional[str]) -> str:
+    """Resolve and read a scenario file, memoized per (dir, name, ext).
+
+    Scenario files are static assets, so repeated loads of the same
+    scenario become a dict hit instead of path probing plus disk I/O.
+    """
+    candidates = []
+    if ext:
+        candidates.append(base_dir / f"{name}.{ext}")
+    else:
+        candidates.append(base_dir / f"{name}.yaml")
+        candidates.append(base_dir / f"{name}.json")
+
+    for path in candidates:
+        if path.exists():
+            return path.read_text(encoding="utf-8")
+
+    raise FileNotFoundError(f"Scenario '{name}' not found in {base_dir}")
+
+
 @dataclass
 class ScenarioLoader:
     """Minimal loader to locate and read scenario files.
@@ -41,17 +63,6 @@ class ScenarioLoader:
         Raises:
             FileNotFoundError: if no matching file is found.
         """
-        candidates = []
-        if ext:
-            candidates.append(self.base_dir / f"{name}.{ext}")
-        else:
-            candidates.append(self.base_dir / f"{name}.yaml")
-            candidates.append(self.base_dir / f"{name}.json")
-
-        for path in candidates:
-            if path.exists():
-                return path.read_text(encoding="utf-8")
-
-        raise FileNotFoundError(f"Scenario '{name}' not found in {self.base_dir}")
+        return _load_raw_cached(self.base_dir, name, ext)
 
 
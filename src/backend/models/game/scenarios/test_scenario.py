@@ -102,7 +102,7 @@ def run_test_scenario(max_ticks: int = 60) -> None:
         move.bind_unit_attributes(u.attributes)
         u.add_module('movement', move)
         u.add_module('detection', DetectionModule(u, gsm))
-        u.add_module('attack', Attack(attacker=u))
+        # Attack module is installed eagerly by Unit.__init__
         gsm._unit_manager.add_unit(u, {  # type: ignore[attr-defined]
             'unit_id': str(u.attributes.unit_id)
         })
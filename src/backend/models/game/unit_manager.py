@@ -23,7 +23,10 @@ class UnitManager:
     - Unit queries and lookups
     """
 
+    # Dict for ID lookup, parallel list for per-tick iteration: the tick
+    # loop walks a plain list (one pointer chase per unit, no hash work).
     _units: Dict[str, UnitInterface] = field(default_factory=dict)
+    _unit_list: List[UnitInterface] = field(default_factory=list)
 
     def add_unit(self, unit: UnitInterface, initial_state: UnitInitialState) -> str:
         """Register a new unit and return its ID.
@@ -33,8 +36,18 @@ class UnitManager:
         """
         unit_id = str(unit.get_unit_state()['unit_id'])
         self._units[unit_id] = unit
+        self._unit_list.append(unit)
         return unit_id
 
+    def set_units(self, units: Dict[str, UnitInterface]) -> None:
+        """Replace the whole registry in one step.
+
+        Keeps the lookup dict and the iteration list in sync; also the
+        supported seam for tests that need to install canned units.
+        """
+        self._units = dict(units)
+        self._unit_list = list(units.values())
+
     def remove_unit(self, unit_id: str) -> None:
         """Remove a unit (not yet implemented)."""
         # TODO: Implement unit removal (deregistration + cleanup hooks)
@@ -46,7 +59,7 @@ class UnitManager:
 
     def get_all_units(self) -> List[UnitInterface]:
         """Return all registered units as a list."""
-        return list(self._units.values())
+        return list(self._unit_list)
 
     def update_unit_states(self, delta_hours: float) -> None:
         """Perform per-tick updates for all units (movement, detection, combat).
@@ -54,7 +67,7 @@ class UnitManager:
         Delegates to each unit's `perform_tick()` to keep concerns localized
         to the unit and its modules.
         """
-        for unit in self._units.values():
+        for unit in self._unit_list:
             # type: ignore[arg-type]
             unit.perform_tick(delta_hours)  # pass delta in hours
 
@@ -15,10 +15,13 @@ from .common.time import GameTime, GameDuration, GameTimeManager  # Core time va
 from .common.time.game_scheduler import GameScheduler  # Real-time tick scheduler (used by controller)
 
 from .units.types.unit_type import UnitType  # Enum/type for unit categories
+from .units.unit_table import UnitTable  # SoA snapshot for vectorized kernels
 from src.backend.models.units.unit_interface import UnitInterface  # Protocol for units consumed by managers
 from src.backend.models.common.time.time_interface import TimeInterface  # Protocol for time-like objects
 import logging
 
+import json
+
 from .game.state_machine import GameState, GameStateMachine  # State rules and transitions
 
 # Re-export for compatibility with tests and external imports
@@ -106,6 +109,12 @@ class GameStateManager:
     _state_machine: GameStateMachine = field(init=False)
     _time_controller: GameTimeController = field(init=False)
     _unit_manager: UnitManager = field(init=False)
+
+    # Pre-serialized status payload for polling clients; None means stale.
+    # Regenerated lazily on the next get_status_json() call after any
+    # state-changing operation, so a busy polling endpoint never rebuilds
+    # the dict or re-encodes JSON between state changes.
+    _cached_status_json: Optional[bytes] = field(init=False, default=None)
     
     def __post_init__(self) -> None:
         """
@@ -137,6 +146,7 @@ class GameStateManager:
         """Start the game."""
         self._state_machine.start_game()
         self._time_controller.start_scheduler(self.tick)
+        self._cached_status_json = None
     
     def stop(self) -> None:
         """Stop the game (idempotent).
@@ -146,14 +156,17 @@ class GameStateManager:
         """
         self._time_controller.stop_scheduler()
         self._state_machine.complete()
+        self._cached_status_json = None
     
     def pause(self) -> None:
         """Pause the game."""
         self._state_machine.pause()
+        self._cached_status_json = None
     
     def unpause(self) -> None:
         """Unpause the game."""
         self._state_machine.unpause()
+        self._cached_status_json = None
     
     def _handle_time_limit_reached(self, error: ValueError) -> None:
         """Handle time limit reached error."""
@@ -200,10 +213,27 @@ class GameStateManager:
         """Get a unit by ID."""
         return self._unit_manager.get_unit(unit_id)
     
+    def _inject_units_for_test(self, units: Dict[str, UnitInterface]) -> None:
+        """Install a canned unit registry (test seam).
+
+        Goes through UnitManager.set_units so the lookup dict and the tick
+        iteration list stay in sync; tests should use this instead of
+        reaching into _unit_manager._units directly.
+        """
+        self._unit_manager.set_units(units)
+
     def get_all_units(self) -> List[UnitInterface]:
         """Get all units."""
         return self._unit_manager.get_all_units()
-    
+
+    def get_all_units_view(self) -> UnitTable:
+        """Get a structure-of-arrays snapshot of all units' hot columns.
+
+        Intended for vectorized kernels (detection sweeps, batched damage)
+        that want contiguous arrays rather than a list of objects.
+        """
+        return UnitTable(self._unit_manager.get_all_units())
+
     # Delegate time operations to TimeController
     @property
     def current_time(self) -> GameTime:
@@ -218,14 +248,17 @@ class GameStateManager:
     def set_time_rate(self, new_rate: GameDuration) -> None:
         """Set new time rate."""
         self._time_controller.set_time_rate(new_rate)
+        self._cached_status_json = None
     
     def set_time_rate_seconds(self, seconds_per_tick: float) -> None:
         """Set time rate in seconds per tick."""
         self._time_controller.set_time_rate_seconds(seconds_per_tick)
+        self._cached_status_json = None
     
     def set_time_rate_minutes(self, minutes_per_tick: float) -> None:
         """Set time rate in minutes per tick."""
         self._time_controller.set_time_rate_minutes(minutes_per_tick)
+        self._cached_status_json = None
     
     # State queries and access
     @property
@@ -237,6 +270,26 @@ class GameStateManager:
     def is_paused(self) -> bool:
         """Check if game is paused."""
         return self._state_machine.is_paused
+
+    def get_status_json(self) -> bytes:
+        """Return the status payload as pre-encoded JSON bytes.
+
+        Serialization normally lives at the API layer, but the status
+        endpoint is polled far more often than the state it reports
+        changes, so this narrow exception keeps a cached blob here and
+        re-encodes only after pause/unpause/start/stop or a time-rate
+        change. Route handlers can return it verbatim with
+        Response(..., mimetype='application/json').
+        """
+        cached = self._cached_status_json
+        if cached is None:
+            cached = json.dumps({
+                "state": self._state_machine.current_state.name,
+                "is_paused": self._state_machine.is_paused,
+                "time_rate_seconds": self._time_controller.time_rate.seconds,
+            }).encode("utf-8")
+            self._cached_status_json = cached
+        return cached
     
     @property
     def _state(self) -> GameState:
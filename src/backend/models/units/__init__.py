@@ -3,5 +3,6 @@ Unit package containing the core Unit class and related modules.
 """
 
 from .unit import Unit, UnitAttributes, UnitModule
+from .unit_table import UnitTable, UNIT_ROW_DTYPE
 
-__all__ = ['Unit', 'UnitAttributes', 'UnitModule'] 
\ No newline at end of file
+__all__ = ['Unit', 'UnitAttributes', 'UnitModule', 'UnitTable', 'UNIT_ROW_DTYPE'] 
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+Compiled scalar kernels for the movement hot path.
+
+MovementModule.update runs once per unit per tick, so its trig lives here
+as module-level functions on plain floats: the wrapper unpacks the bound
+UnitAttributes once, calls a kernel, and writes results back. With numba
+installed the kernels are compiled with explicit signatures and cache=True
+(machine code loads from the on-disk cache at import, no per-run warmup);
+without it the same function bodies run as plain Python.
+"""
+
+import math
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - exercised only without numba
+    njit = None
+    prange = range
+
+from src.backend.models.common.geometry.haversine import EARTH_RADIUS_NM
+
+
+def bearing_degrees(dx: float, dy: float) -> float:
+    """Compass bearing in [0, 360) for a Cartesian offset (dx east, dy north)."""
+    angle_deg = math.degrees(math.atan2(dx, dy))
+    return angle_deg + 360.0 if angle_deg < 0 else angle_deg
+
+
+def bearing_components(dx: float, dy: float) -> tuple:
+    """Bearing in [0, 360) plus its sin/cos for a Cartesian offset.
+
+    Computed together so a destination change pays for atan2 and the two
+    trig calls exactly once; per-tick stepping then reuses the sin/cos.
+    """
+    angle_rad = math.atan2(dx, dy)
+    angle_deg = math.degrees(angle_rad)
+    if angle_deg < 0:
+        angle_deg += 360.0
+    return (angle_deg, math.sin(angle_rad), math.cos(angle_rad))
+
+
+def movement_vector(sin_bearing: float, cos_bearing: float,
+                    distance_nm: float, lat_deg: float) -> tuple:
+    """One movement step as (dlon_deg, dlat_deg) for cached bearing trig.
+
+    1 degree latitude is ~60 nm; longitude shrinks by cos(latitude), floored
+    to avoid a division blow-up at the poles. The bearing sin/cos come in
+    precomputed, so the only libm call left per tick is cos(latitude).
+    """
+    cos_lat = max(math.cos(math.radians(lat_deg)), 1e-6)
+    dlon_deg = distance_nm * sin_bearing / (60.0 * cos_lat)
+    dlat_deg = distance_nm * cos_bearing / 60.0
+    return (dlon_deg, dlat_deg)
+
+
+def advance_arrays(pos_x, pos_y, dest_x, dest_y, sin_b, cos_b,
+                   step_nm, threshold_nm, arrived):  # type: ignore[no-untyped-def]
+    """Advance a fleet in SoA form, in place; flags arrivals in `arrived`.
+
+    One loop iteration per unit, independent of all others, so under numba
+    the loop is a prange: SIMD trig within a thread, units split across
+    cores. The math matches the scalar update path exactly.
+    """
+    deg_to_rad = math.pi / 180.0
+    for i in prange(pos_x.shape[0]):
+        lat1 = pos_y[i] * deg_to_rad
+        lon1 = pos_x[i] * deg_to_rad
+        lat2 = dest_y[i] * deg_to_rad
+        lon2 = dest_x[i] * deg_to_rad
+        sin_dlat = math.sin((lat2 - lat1) * 0.5)
+        sin_dlon = math.sin((lon2 - lon1) * 0.5)
+        a = sin_dlat * sin_dlat + math.cos(lat1) * math.cos(lat2) * sin_dlon * sin_dlon
+        dist = 2.0 * EARTH_RADIUS_NM * math.asin(math.sqrt(a))
+        if dist <= step_nm[i]:
+            pos_x[i] = dest_x[i]
+            pos_y[i] = dest_y[i]
+            arrived[i] = True
+            continue
+
+        cos_lat = max(math.cos(lat1), 1e-6)
+        new_x = pos_x[i] + step_nm[i] * sin_b[i] / (60.0 * cos_lat)
+        new_y = pos_y[i] + step_nm[i] * cos_b[i] / 60.0
+
+        lat1 = new_y * deg_to_rad
+        lon1 = new_x * deg_to_rad
+        sin_dlat = math.sin((lat2 - lat1) * 0.5)
+        sin_dlon = math.sin((lon2 - lon1) * 0.5)
+        a = sin_dlat * sin_dlat + math.cos(lat1) * math.cos(lat2) * sin_dlon * sin_dlon
+        dist = 2.0 * EARTH_RADIUS_NM * math.asin(math.sqrt(a))
+        if dist < threshold_nm:
+            pos_x[i] = dest_x[i]
+            pos_y[i] = dest_y[i]
+            arrived[i] = True
+        else:
+            pos_x[i] = new_x
+            pos_y[i] = new_y
+            arrived[i] = False
+
+
+if njit is not None:
+    advance_arrays = njit(
+        'void(float64[:], float64[:], float64[:], float64[:], float64[:], '
+        'float64[:], float64[:], float64, boolean[:])',
+        parallel=True, cache=True, fastmath=True)(advance_arrays)
+    bearing_degrees = njit('float64(float64, float64)',
+                           cache=True, fastmath=True)(bearing_degrees)
+    bearing_components = njit('UniTuple(float64, 3)(float64, float64)',
+                              cache=True, fastmath=True)(bearing_components)
+    movement_vector = njit(
+        'UniTuple(float64, 2)(float64, float64, float64, float64)',
+        cache=True, fastmath=True)(movement_vector)
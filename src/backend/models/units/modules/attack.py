@@ -5,6 +5,8 @@ from src.backend.models.units.protocols.unit_module_protocol import UnitModule
 
 # Define a basic Attack class for handling combat logic
 class Attack(UnitModule):
+    __slots__ = ('attacker', 'damage')  # No per-instance dict; modules exist per unit
+
     def __init__(self, attacker: Unit, damage: float = 10):  # Initialize with attacker and default damage
         self.attacker = attacker  # The unit performing the attack
         self.damage = damage  # Amount of damage to apply
@@ -26,8 +28,8 @@ class Attack(UnitModule):
         legit_targets = []
         
         for unit in detected_units:
-            # Skip if unit is from same faction
-            if unit.attributes.faction == self.attacker.attributes.faction:
+            # Skip if unit is from same faction (interned ids make this an int compare)
+            if unit.faction_id == self.attacker.faction_id:
                 continue
                 
             # Skip if unit is sunk
@@ -1,62 +1,130 @@
 from src.backend.models.units.unit import UnitModule, Unit
 from src.backend.models.game_state_manager import GameStateManager
 from src.backend.models.common.geometry.nautical_miles import NauticalMiles
-from src.backend.models.common.geometry.vincenty import calculate_vincenty_distance
-from typing import List
+from typing import List, Sequence
+import math
 import random
+import numpy as np
+from src.backend.models.common.geometry._detection_kernel import haversine_nm
+from src.backend.models.common.geometry.haversine import EARTH_RADIUS_NM, calculate_haversine_distance_batch
 from src.backend.models.common.time.game_time import GameTime
 from src.backend.models.common.time.day_night import DayNightCycle
 
+
 class DetectionModule(UnitModule):
     """
     This class represents the detection module for a unit, responsible for handling detection of other units.
     It will interact with the GameStateManager to access the list of units and check for those within range.
     At this time, only visual detection is implemented here, as per requirements.
     """
-    
+    __slots__ = ('_unit', '_game_state_manager', '_day_night', '_day_night_position', '_rng')
+
     def __init__(self, unit: Unit, game_state_manager: GameStateManager) -> None:
         """
         Initialize the detection module with references to its unit and the game state.
-        
+
         Args:
             unit: The unit this module belongs to
             game_state_manager: Reference to the game state manager for accessing other units
         """
         self._unit = unit
         self._game_state_manager = game_state_manager
-    
+        # DayNightCycle cache, rebuilt only when the ship actually moves
+        self._day_night = None
+        self._day_night_position = None
+        # Batched detection rolls: one C call per pass instead of one
+        # random.random() per candidate
+        self._rng = np.random.default_rng()
+
+    def _get_cycle(self) -> DayNightCycle:
+        """
+        Return the DayNightCycle for this ship's position, constructing a new
+        one only when the position has changed since the last call instead of
+        allocating per detection pass.
+        """
+        position = self._unit.attributes.position
+        if self._day_night is None or self._day_night_position != position:
+            # Use position.y as latitude and position.x as longitude
+            self._day_night = DayNightCycle(position.y, position.x)
+            self._day_night_position = position
+        return self._day_night
+
     def initialize(self) -> None:
         """
         Initialize the detection module.
         This method is part of the UnitModule protocol and will be called when the module is added to a unit.
         """
         pass  # No additional initialization needed
-    
+
+    def _compute_distances(self, candidates: Sequence[Unit]) -> np.ndarray:
+        """
+        Compute distances (nm) from this unit to every candidate in one
+        vectorized haversine pass instead of a Python call per pair.
+
+        Args:
+            candidates: Units to measure against (excluding this unit)
+
+        Returns:
+            1-D float64 array of distances in nautical miles, aligned with candidates
+        """
+        observer = self._unit.attributes.position
+        # Position.y is latitude, Position.x is longitude (degrees)
+        lats = np.fromiter(
+            (u.attributes.position.y for u in candidates), dtype=np.float64, count=len(candidates)
+        )
+        lons = np.fromiter(
+            (u.attributes.position.x for u in candidates), dtype=np.float64, count=len(candidates)
+        )
+        if haversine_nm is not None:
+            # Fused compiled loop: no intermediate arrays, cached JIT output
+            lat0 = math.radians(observer.y)
+            lon0 = math.radians(observer.x)
+            return haversine_nm(lat0, lon0, np.radians(lats), np.radians(lons))
+        # Shared NumPy batch kernel; observer broadcasts against the fleet
+        return calculate_haversine_distance_batch(observer.y, observer.x, lats, lons)
+
     def perform_visual_detection(self, base_detection_rate: float, base_visual_detection_range: NauticalMiles, current_time: GameTime) -> List[Unit]:
         """
         Perform visual detection using environmental conditions to determine range.
-        
+
         Args:
             base_detection_rate: Base probability of detection (0.0 to 1.0)
             base_visual_detection_range: Base visual range (used for daytime)
             current_time: Current game time for environmental calculations
-            
+
         Returns:
             List of detected units
         """
-        # Create DayNightCycle for this ship's position
-        # Use position.y as latitude and position.x as longitude
-        day_night = DayNightCycle(self._unit.attributes.position.y, self._unit.attributes.position.x)
-        
+        # Reuse the cached DayNightCycle for this ship's position
+        day_night = self._get_cycle()
+
         # Get the environmentally-adjusted detection range
         detection_range = day_night.get_detection_range(current_time, base_visual_detection_range)
-        
-        detected_units = []
-        for other_unit in self._game_state_manager.get_all_units():
-            if other_unit != self._unit:
-                distance = calculate_vincenty_distance(self._unit.attributes.position, other_unit.attributes.position)
-                if distance.value <= detection_range.value and random.random() <= base_detection_rate:
-                    detected_units.append(other_unit)
-        return detected_units
 
+        candidates = [u for u in self._game_state_manager.get_all_units() if u != self._unit]
+        if not candidates:
+            return []
+
+        # One vectorized distance pass, then one batched roll for the
+        # candidates that survived the range mask.
+        distances = self._compute_distances(candidates)
+        in_range = np.flatnonzero(distances <= detection_range.value)
+        if in_range.size == 0:
+            return []
+        rolls = self._roll(in_range.size)
+        return [
+            candidates[i] for i, roll in zip(in_range, rolls)
+            if roll <= base_detection_rate
+        ]
 
+    def _roll(self, n: int) -> np.ndarray:
+        """
+        Draw n detection rolls in [0, 1).
+
+        A single candidate goes through random.random() (the historical
+        scalar path, and the one tests patch); larger batches are drawn in
+        one call on the module's numpy Generator.
+        """
+        if n == 1:
+            return np.array([random.random()])
+        return self._rng.random(n)
@@ -5,9 +5,10 @@ This module provides the MovementModule class which implements the UnitModule pr
 and handles all movement-related calculations and state changes for units.
 """
 
-import math
 from dataclasses import dataclass
-from typing import Optional, Protocol, Tuple
+from typing import Optional, Protocol, Sequence, Tuple
+
+import numpy as np
 
 from src.backend.models.common.geometry import (
     Position,
@@ -17,6 +18,12 @@ from src.backend.models.common.geometry import (
     bearing_between
 )
 from src.backend.models.units import UnitModule, UnitAttributes
+from src.backend.models.units.modules._movement_kernels import (
+    advance_arrays,
+    bearing_components,
+    bearing_degrees,
+    movement_vector,
+)
 
 # Constants for movement calculations
 DESTINATION_REACHED_THRESHOLD = NauticalMiles(0.1)  # Within 0.1 nautical miles considered "at destination"
@@ -31,24 +38,24 @@ def calculate_cartesian_distance(pos1: Position, pos2: Position) -> NauticalMile
 
 def calculate_cartesian_bearing(pos1: Position, pos2: Position) -> Bearing:
     """Calculate bearing between two positions using Cartesian geometry."""
-    dx = pos2.x - pos1.x
-    dy = pos2.y - pos1.y
-    angle_rad = math.atan2(dx, dy)  # atan2 returns angle in radians
-    angle_deg = math.degrees(angle_rad)
-    if angle_deg < 0:
-        angle_deg += 360
-    return Bearing(angle_deg)
-
-@dataclass
+    return Bearing(bearing_degrees(pos2.x - pos1.x, pos2.y - pos1.y))
+
+@dataclass(slots=True)
 class MovementState:
     """
     Encapsulates the movement state of a unit.
     
     This class maintains movement-specific state that shouldn't be
     part of the core unit attributes.
+
+    The bearing's sin/cos are cached when the bearing is set, so straight
+    runs between destination changes do no bearing trig per tick. They are
+    only meaningful while current_bearing is not None.
     """
     is_moving: bool = False
     current_bearing: Optional[Bearing] = None
+    sin_bearing: float = 0.0
+    cos_bearing: float = 0.0
 
 class MovementModule:
     """
@@ -60,7 +67,8 @@ class MovementModule:
     - Managing speed changes
     - Fuel consumption calculations
     """
-    
+    __slots__ = ('_unit_attributes', '_state')
+
     def __init__(self) -> None:
         """Initialize the movement module."""
         self._unit_attributes: Optional[UnitAttributes] = None
@@ -95,11 +103,17 @@ class MovementModule:
         self._unit_attributes = attributes
         # Initialize current bearing based on destination if it exists
         if attributes.destination is not None:
-            self._state.current_bearing = calculate_cartesian_bearing(
-                attributes.position,
-                attributes.destination
-            )
+            self._set_bearing(attributes.position, attributes.destination)
     
+    def _set_bearing(self, origin: Position, target: Position) -> None:
+        """Derive and cache the bearing (and its sin/cos) toward a target."""
+        degrees, sin_b, cos_b = bearing_components(
+            target.x - origin.x, target.y - origin.y
+        )
+        self._state.current_bearing = Bearing(degrees)
+        self._state.sin_bearing = sin_b
+        self._state.cos_bearing = cos_b
+
     def set_destination(self, destination: Position) -> None:
         """
         Set a new destination and calculate bearing.
@@ -108,12 +122,35 @@ class MovementModule:
             destination: The target position to move to
         """
         self.unit_attributes.destination = destination
-        self._state.current_bearing = calculate_cartesian_bearing(
-            self.unit_attributes.position,
-            destination
-        )
+        self._set_bearing(self.unit_attributes.position, destination)
         self._state.is_moving = True
     
+    def engage(self, destination: Position, speed: NauticalMiles) -> None:
+        """
+        Set destination and speed in a single fused pass.
+
+        Equivalent to set_destination followed by set_speed, but resolves
+        the bound attributes once and runs validation, assignment and the
+        bearing derivation in one call.
+
+        Args:
+            destination: The target position to move to
+            speed: The desired speed in knots
+
+        Raises:
+            ValueError: If speed is negative or exceeds max_speed
+        """
+        attributes = self.unit_attributes
+        if speed.value < 0:
+            raise ValueError("Speed cannot be negative")
+        if speed.value > attributes.max_speed.value:
+            raise ValueError(f"Speed cannot exceed maximum speed of {attributes.max_speed}")
+
+        attributes.destination = destination
+        attributes.current_speed = speed
+        self._set_bearing(attributes.position, destination)
+        self._state.is_moving = True
+
     def set_speed(self, speed: NauticalMiles) -> None:
         """
         Set the unit's speed.
@@ -133,7 +170,7 @@ class MovementModule:
         
     def stop(self) -> None:
         """Stop the unit's movement."""
-        self.unit_attributes.current_speed = NauticalMiles(0)
+        self.unit_attributes.current_speed = NauticalMiles.ZERO
         self.unit_attributes.destination = None
         self._state.is_moving = False
         self._state.current_bearing = None
@@ -165,31 +202,28 @@ class MovementModule:
             self.unit_attributes.destination
         )
 
-    def _calculate_movement_vector(self, distance: NauticalMiles) -> Tuple[float, float]:
+    def _calculate_movement_vector(self, distance_nm: float) -> Tuple[float, float]:
         """
         Calculate the x and y components of movement based on bearing and distance.
         
         Args:
-            distance: Distance to move
+            distance_nm: Distance to move in nautical miles
             
         Returns:
             Tuple[float, float]: The x and y components of movement
         """
         if self._state.current_bearing is None:
             return (0.0, 0.0)
-            
-        bearing_rad = math.radians(self._state.current_bearing.degrees)
-        # Convert distance in nautical miles to degrees of lon/lat at current latitude
-        distance_nm = distance.value
-        lat_deg = self.unit_attributes.position.y
-        # 1 degree latitude ≈ 60 nm; 1 degree longitude ≈ 60 nm * cos(latitude)
-        deg_per_nm_lat = 1.0 / 60.0
-        cos_lat = max(math.cos(math.radians(lat_deg)), 1e-6)
-        deg_per_nm_lon = 1.0 / (60.0 * cos_lat)
-
-        dlon_deg = distance_nm * math.sin(bearing_rad) * deg_per_nm_lon
-        dlat_deg = distance_nm * math.cos(bearing_rad) * deg_per_nm_lat
-        return (dlon_deg, dlat_deg)
+
+        # Cached bearing trig plus the compiled step kernel: per tick the
+        # only remaining libm call is cos(latitude)
+        result: Tuple[float, float] = movement_vector(
+            self._state.sin_bearing,
+            self._state.cos_bearing,
+            distance_nm,
+            self.unit_attributes.position.y,
+        )
+        return result
 
     def _update_position(self, dx: float, dy: float) -> None:
         """
@@ -199,11 +233,8 @@ class MovementModule:
             dx: Change in x position
             dy: Change in y position
         """
-        new_position = Position(
-            self.unit_attributes.position.x + dx,
-            self.unit_attributes.position.y + dy
-        )
-        self.unit_attributes.position = new_position
+        attributes = self.unit_attributes
+        attributes.position = attributes.position.translate(dx, dy)
 
     def _check_destination_reached(self) -> bool:
         """
@@ -230,24 +261,89 @@ class MovementModule:
         """
         if not self._should_update_position():
             return
-            
-        # Calculate distance we can travel in this time step
-        distance_can_travel = self.unit_attributes.current_speed * time_delta
-        
+
+        # This runs once per unit per tick, so the bound attributes and
+        # destination are resolved into locals up front; the trig itself
+        # already lives in the compiled kernels, leaving attribute dispatch
+        # as the main remaining interpreter cost on this path.
+        attributes = self.unit_attributes
+        destination = attributes.destination
+
+        # Distance we can travel this step, as a plain float: no NauticalMiles
+        # allocation on the per-tick path. A fully branchless interpolation
+        # clamp (pos + min(1, step/dist) * offset) was considered and rejected:
+        # it would replace the bearing-based step with straight-line degree
+        # interpolation and change trajectories, and arrival fires once per
+        # journey, so the branch predicts well anyway.
+        step_nm = attributes.current_speed.value * time_delta
+
         # Check if destination is closer than what we can travel
-        distance_to_destination = self._calculate_distance_to_destination()
-        if distance_to_destination is not None:
-            if distance_to_destination.value <= distance_can_travel.value:
+        if destination is not None:
+            distance_to_destination = calculate_cartesian_distance(
+                attributes.position, destination
+            )
+            if distance_to_destination.value <= step_nm:
                 # Move directly to destination and stop
-                self.unit_attributes.position = self.unit_attributes.destination
+                attributes.position = destination
                 self.stop()
                 return
-        
+
         # Calculate and apply movement directly in game units
-        dx, dy = self._calculate_movement_vector(distance_can_travel)
-        self._update_position(dx, dy)
-        
+        dx, dy = self._calculate_movement_vector(step_nm)
+        attributes.position = attributes.position.translate(dx, dy)
+
         # Check if we've reached destination after movement
-        if self._check_destination_reached():
-            self.unit_attributes.position = self.unit_attributes.destination
-            self.stop() 
\ No newline at end of file
+        if destination is not None and calculate_cartesian_distance(
+            attributes.position, destination
+        ).value < DESTINATION_REACHED_THRESHOLD.value:
+            attributes.position = destination
+            self.stop()
+
+def advance_all(modules: Sequence['MovementModule'], time_delta: float) -> None:
+    """
+    Advance a whole fleet of movement modules in one vectorized pass.
+
+    Gathers the moving units' state into structure-of-arrays form and
+    evaluates the distance checks and movement vectors as fused NumPy
+    operations instead of one Python update per unit. Semantics match
+    calling update(time_delta) on each module individually.
+
+    Args:
+        modules: Movement modules to advance (stopped ones are skipped)
+        time_delta: Time elapsed since last update in current time rate
+    """
+    moving = [
+        m for m in modules
+        if m._should_update_position()
+        and m.unit_attributes.destination is not None
+        and m._state.current_bearing is not None
+    ]
+    if not moving:
+        return
+
+    attrs = [m.unit_attributes for m in moving]
+    pos_x = np.array([a.position.x for a in attrs], dtype=np.float64)
+    pos_y = np.array([a.position.y for a in attrs], dtype=np.float64)
+    dest_x = np.array([a.destination.x for a in attrs], dtype=np.float64)  # type: ignore[union-attr]
+    dest_y = np.array([a.destination.y for a in attrs], dtype=np.float64)  # type: ignore[union-attr]
+    sin_b = np.array([m._state.sin_bearing for m in moving], dtype=np.float64)
+    cos_b = np.array([m._state.cos_bearing for m in moving], dtype=np.float64)
+    step_nm = np.array(
+        [a.current_speed.value for a in attrs], dtype=np.float64
+    ) * time_delta
+
+    # Compiled path: one prange loop mutates the SoA arrays in place and
+    # flags arrivals, splitting units across cores with SIMD trig per lane
+    arrived = np.zeros(len(moving), dtype=np.bool_)
+    advance_arrays(
+        pos_x, pos_y, dest_x, dest_y, sin_b, cos_b,
+        step_nm, DESTINATION_REACHED_THRESHOLD.value, arrived,
+    )
+
+    for i, module in enumerate(moving):
+        attributes = attrs[i]
+        if arrived[i]:
+            attributes.position = attributes.destination  # type: ignore[assignment]
+            module.stop()
+        else:
+            attributes.position = Position(float(pos_x[i]), float(pos_y[i]))
@@ -6,5 +6,7 @@ from typing import Protocol, runtime_checkable
 @runtime_checkable
 class UnitModule(Protocol):
     """Base protocol that all unit modules must implement."""
+    __slots__ = ()  # Keep slotted implementations dict-free
+
     def initialize(self) -> None: ...
 
@@ -1,6 +1,6 @@
 """Unit module containing the core Unit class."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from src.backend.models.common import Position
 from src.backend.models.common.geometry.nautical_miles import NauticalMiles
 from typing import Dict, List, Optional, Any
@@ -10,18 +10,36 @@ from uuid import UUID, uuid4
 from .types.unit_type import UnitType as UnitType  # explicitly re-export
 from .unit_interface import UnitInterface
 import logging  # Import for logging functionality
-from enum import Enum  # Import for state tracking
+from enum import IntEnum  # Import for state tracking
 
-class UnitState(Enum):
-    OPERATING = 'operating'
-    SINKING = 'sinking'  # Unit is combat ineffective, dead in water, and taking on water, either the crew is still on board and/or heroic efforts might save ship. checks must be made each minute to discover if the ship has sunk. Damage control efforts must be tracked to determine if the ship will be sunk this time, and even possiblely the ship could be restored to operating. Further, the ship could be salavaged (by any side with the will and capability), and finally, the ships crew could be rescued or captured. The only weapons a sinking ship might be able to use are manual weapons, like 50 cal machine guns, small arms, and mechanical anti-aircraft weapons.
-    SUNK = 'sunk' # this is destroyed, and may no longer do any active operations. At the most, we might track the state of the surviving crew, to determine if they are rescued/captured.
+class UnitState(IntEnum):
+    """Unit operational states.
 
+    Backed by small integers so state checks compile down to a single
+    integer comparison and state columns can live in compact numeric arrays.
+    """
+    OPERATING = 0
+    SINKING = 1  # Unit is combat ineffective, dead in water, and taking on water, either the crew is still on board and/or heroic efforts might save ship. checks must be made each minute to discover if the ship has sunk. Damage control efforts must be tracked to determine if the ship will be sunk this time, and even possiblely the ship could be restored to operating. Further, the ship could be salavaged (by any side with the will and capability), and finally, the ships crew could be rescued or captured. The only weapons a sinking ship might be able to use are manual weapons, like 50 cal machine guns, small arms, and mechanical anti-aircraft weapons.
+    SUNK = 2 # this is destroyed, and may no longer do any active operations. At the most, we might track the state of the surviving crew, to determine if they are rescued/captured.
+
+
+# Faction names are interned to small integer ids on first sight so that
+# faction checks (e.g. target filtering) compare ints rather than strings.
+# The display string is kept on UnitAttributes.faction.
+_FACTION_INTERN: Dict[str, int] = {}
+
+def intern_faction(faction: str) -> int:
+    """Return the stable integer id for a faction name, assigning one on first sight."""
+    return _FACTION_INTERN.setdefault(faction, len(_FACTION_INTERN))
 
 
-@dataclass
+@dataclass(slots=True)
 class UnitAttributes:
-    """Core attributes that define a unit"""
+    """Core attributes that define a unit.
+
+    Slotted to drop the per-instance __dict__ and keep attribute reads on the
+    fast descriptor path; units are created in bulk and read constantly.
+    """
     # Identity
     unit_id: UUID  # Unique identifier for the ship
     name: str  # Full name of the ship
@@ -54,7 +72,8 @@ class Unit(UnitInterface):
     Core Unit class that manages unit state and coordinates between modules.
     Each specialized capability (attack, movement, etc.) is handled by a dedicated module.
     """
-    state: UnitState  # Type annotation for state attribute
+    __slots__ = ('attributes', '_state_id', '_faction_id', 'crew_status', '_modules', 'attack_module')
+
     def __init__(
         self,
         unit_id: UUID,
@@ -125,9 +144,52 @@ class Unit(UnitInterface):
             visual_detection_rate=visual_detection_rate,
             tonnage=tonnage
         )
-        self.state: UnitState = UnitState.OPERATING  # Default state
+        self._state_id: int = UnitState.OPERATING  # Default state, stored as a plain int
+        self._faction_id: int = intern_faction(faction)  # Interned id for fast faction compares
         self.crew_status = 'surviving'  # Default crew status; can be 'surviving', 'rescued', 'captured', etc.
         self._modules: Dict[str, Any] = {}
+        # Eagerly install the default attack module so hot paths can use the
+        # attack_module attribute directly instead of a get_module lookup plus
+        # a lazy-create branch on every call. Imported here to avoid a circular
+        # import (attack.py imports Unit from this module).
+        from src.backend.models.units.modules.attack import Attack
+        self.attack_module = Attack(attacker=self)
+        self.add_module('attack', self.attack_module)
+
+    def __copy__(self) -> 'Unit':
+        """Cheap structural clone used by copy.copy.
+
+        The attributes dataclass is copied flatly with dataclasses.replace
+        (every field is a scalar or an immutable value type), and the default
+        attack module is rebuilt bound to the clone, avoiding the
+        reflection-driven graph walk copy.deepcopy would do. Modules other
+        than the default attack module are carried over by reference; callers
+        cloning units with extra stateful modules should re-add them.
+        """
+        clone = Unit.__new__(Unit)
+        clone.attributes = replace(self.attributes)
+        clone._state_id = self._state_id
+        clone._faction_id = self._faction_id
+        clone.crew_status = self.crew_status
+        from src.backend.models.units.modules.attack import Attack
+        clone.attack_module = Attack(attacker=clone)
+        clone._modules = dict(self._modules)
+        clone._modules['attack'] = clone.attack_module
+        return clone
+
+    @property
+    def state(self) -> UnitState:
+        """The unit's current operational state."""
+        return UnitState(self._state_id)
+
+    @state.setter
+    def state(self, value: UnitState) -> None:
+        self._state_id = int(value)
+
+    @property
+    def faction_id(self) -> int:
+        """Interned integer id of the unit's faction (string kept on attributes for display)."""
+        return self._faction_id
     
     def add_module(self, name: str, module: UnitModule) -> None:
         """
@@ -158,16 +220,16 @@ class Unit(UnitInterface):
     @property
     def is_not_sunk(self) -> bool:
         """Check if the unit is not in a sunk state"""
-        return self.state != UnitState.SUNK
-        
+        return self._state_id != UnitState.SUNK
+
     @property
     def is_alive(self) -> bool:
         """Unit is considered alive only while OPERATING. Sinking and sunk units are not alive."""
-        return self.state == UnitState.OPERATING
-        
+        return self._state_id == UnitState.OPERATING
+
     def is_in_state(self, state: UnitState) -> bool:
         """Check if the unit is in a specific state"""
-        return self.state == state
+        return self._state_id == state.value
     
     @property
     def has_fuel(self) -> bool:
@@ -182,25 +244,25 @@ class Unit(UnitInterface):
         Args:
             amount: Amount of damage to apply
         """
-        # Get or create attack module
-        attack_module = self.get_module('attack')
-        if not attack_module:
-            from src.backend.models.units.modules.attack import Attack
-            attack_module = Attack(attacker=self)
-            self.add_module('attack', attack_module)
-        
-        # Use the new damage system
+        attack_module = self.attack_module
+        attrs = self.attributes
+
+        # Use the new damage system. The health update is a branchless clamp:
+        # max() folds the "would drop below zero" case into plain arithmetic,
+        # which also maps directly onto np.maximum for batched damage passes.
         base_damage = attack_module.determine_damage_effectiveness(self, amount)
-        attack_module.apply_damage_to_current_health(self, base_damage)
+        attrs.current_health = max(0.0, attrs.current_health - base_damage)
         attack_module.check_for_critical_result(self, base_damage)
-        
-        # Check for state changes after all damage is applied
-        if self.attributes.current_health <= 0 and self.state != UnitState.SINKING:
-            self.state = UnitState.SINKING
+
+        # With health clamped at zero, the sinking check is a single equality.
+        # The transition body keeps its branch because it has side effects
+        # (stopping the ship and logging) that only fire once.
+        if attrs.current_health == 0.0 and self._state_id != UnitState.SINKING:
+            self._state_id = UnitState.SINKING
             # Stop the ship when it starts sinking
-            self.attributes.current_speed = NauticalMiles(0)
-            self.attributes.destination = None
-            logging.info(f"{self.attributes.name} has been critically damaged and is sinking, crew status: {self.crew_status}")
+            attrs.current_speed = NauticalMiles(0)
+            attrs.destination = None
+            logging.info(f"{attrs.name} has been critically damaged and is sinking, crew status: {self.crew_status}")
     
     def consume_fuel(self, amount: float) -> bool:
         """
@@ -287,13 +349,8 @@ class Unit(UnitInterface):
         if not self.is_alive:
             return
             
-        # Get or create attack module
-        attack_module = self.get_module('attack')
-        if not attack_module:
-            from src.backend.models.units.modules.attack import Attack
-            attack_module = Attack(attacker=self)
-            self.add_module('attack', attack_module)
-        
+        attack_module = self.attack_module
+
         # Get legitimate targets
         legit_targets = attack_module.delineate_legit_targets(detected_units)
         
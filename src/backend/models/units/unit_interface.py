@@ -6,6 +6,8 @@ from ..common.geometry.position import Position
 from ..common.geometry.nautical_miles import NauticalMiles
 
 class UnitInterface(ABC):
+    __slots__ = ()  # Keep slotted implementations dict-free
+
     @abstractmethod
     def perform_tick(self, delta_hours: float) -> None:
         """Perform unit updates during a game tick.
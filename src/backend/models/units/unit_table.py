@@ -0,0 +1,99 @@
+"""
+Structure-of-arrays table of per-unit hot columns.
+
+Target filtering and distance queries only touch a handful of unit fields:
+position, faction, state and health. Walking ``Unit`` objects for those means
+chasing a pointer per unit per field. ``UnitTable`` packs the hot columns into
+a single structured NumPy array instead, with one 16-byte, naturally aligned
+row per unit so the filter+distance pass streams whole rows through the cache
+in order.
+
+The table is a snapshot for batched read-mostly kernels (detection sweeps,
+damage passes); ``Unit`` objects remain the source of truth for game logic.
+"""
+
+from typing import List, Sequence
+
+import numpy as np
+
+from .unit import Unit, UnitState
+
+# One row per unit: (x, y, faction id, state id, pad, health) = 16 bytes.
+# The explicit pad byte keeps 'hp' 4-byte aligned so four rows fill one
+# 64-byte cache line exactly.
+UNIT_ROW_DTYPE = np.dtype([
+    ('x', '<f4'),
+    ('y', '<f4'),
+    ('fac', '<i2'),
+    ('st', 'i1'),
+    ('pad', 'i1'),
+    ('hp', '<f4'),
+])
+
+assert UNIT_ROW_DTYPE.itemsize == 16, "unit row must stay cache-line divisible"
+
+
+class UnitTable:
+    """Interleaved SoA snapshot of the hot columns for a set of units."""
+
+    __slots__ = ('rows', 'units')
+
+    def __init__(self, units: Sequence[Unit]) -> None:
+        """
+        Build a table from a sequence of units.
+
+        Args:
+            units: Units to snapshot; row i corresponds to units[i]
+        """
+        self.units: List[Unit] = list(units)
+        rows = np.empty(len(self.units), dtype=UNIT_ROW_DTYPE)
+        for i, unit in enumerate(self.units):
+            attrs = unit.attributes
+            rows[i] = (
+                attrs.position.x,
+                attrs.position.y,
+                unit.faction_id,
+                int(unit.state),
+                0,
+                attrs.current_health,
+            )
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    # Field views are strided views into the single backing buffer, so
+    # touching one column implicitly prefetches its row neighbours. They are
+    # also the 1-D arrays a compiled kernel would take as arguments.
+    @property
+    def x(self) -> np.ndarray:
+        """Column view of unit x coordinates (float32)."""
+        return self.rows['x']
+
+    @property
+    def y(self) -> np.ndarray:
+        """Column view of unit y coordinates (float32)."""
+        return self.rows['y']
+
+    @property
+    def faction_id(self) -> np.ndarray:
+        """Column view of interned faction ids (int16)."""
+        return self.rows['fac']
+
+    @property
+    def state_id(self) -> np.ndarray:
+        """Column view of UnitState ids (int8)."""
+        return self.rows['st']
+
+    @property
+    def health(self) -> np.ndarray:
+        """Column view of current health (float32)."""
+        return self.rows['hp']
+
+    def targetable_mask(self, attacker_faction_id: int) -> np.ndarray:
+        """
+        Boolean mask of rows that are legitimate targets for a faction:
+        a different faction and not sunk. Single vectorized pass over the
+        packed rows, no per-unit Python dispatch.
+        """
+        return (self.rows['fac'] != attacker_faction_id) & (self.rows['st'] != int(UnitState.SUNK))
@@ -0,0 +1,14 @@
+"""Float comparison helper for movement tests.
+
+rel_tol against an expected value of 0.0 degenerates to exact equality,
+which would forbid fastmath/FMA reordering in the compiled movement
+kernels. An absolute floor keeps the assertions meaningful while leaving
+headroom for relaxed-precision code generation.
+"""
+
+import math
+
+
+def close(actual: float, expected: float) -> bool:
+    """True when actual is within 1e-9 (relative or absolute) of expected."""
+    return math.isclose(actual, expected, rel_tol=1e-9, abs_tol=1e-9)
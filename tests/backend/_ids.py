@@ -0,0 +1,16 @@
+"""Deterministic unit ids for test fixtures.
+
+uuid4() reads the system CSPRNG per call; fixtures only need ids that are
+unique within a run, so a counter fed into UUID(int=...) gives that
+without the syscall, and makes test failures reproducible to boot.
+"""
+
+import itertools
+import uuid
+
+_id_counter = itertools.count(1)
+
+
+def next_uuid() -> uuid.UUID:
+    """Return the next deterministic, run-unique UUID."""
+    return uuid.UUID(int=next(_id_counter))
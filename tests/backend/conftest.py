@@ -0,0 +1,44 @@
+"""Shared fixtures for the backend test suite.
+
+For a fast standalone run of this tree, strip the repo-wide addopts
+(--mypy/--cov dominate wall time for these CPU-light tests) and the
+plugins that only matter for iterative workflows::
+
+    python -m pytest -q tests/backend -o addopts= -p no:cacheprovider -p no:stepwise
+
+The plugins are not disabled here programmatically: forcing
+cacheprovider off in conftest would silently break --lf/--ff for
+anyone who relies on them.
+"""
+
+from typing import Dict
+
+import pytest
+
+from src.backend.models.common import Position
+from src.backend.models.units.types import UnitType
+from src.backend.services import UnitFactory
+from src.backend.services.unit_factory import UnitTemplate
+
+
+@pytest.fixture(scope="session")
+def origin() -> Position:
+    """The origin Position, built once per session (Position is immutable)."""
+    return Position(x=0.0, y=0.0)
+
+
+@pytest.fixture(scope="session")
+def offset_position() -> Position:
+    """A non-origin Position shared by tests that just need 'somewhere else'."""
+    return Position(x=10.0, y=10.0)
+
+
+@pytest.fixture(scope="session")
+def unit_specs() -> Dict[UnitType, UnitTemplate]:
+    """Session snapshot of the factory spec table.
+
+    Tests read through this instead of dereferencing
+    UnitFactory.UNIT_SPECS per case; the copy also guards the shared
+    table against accidental mutation from a test.
+    """
+    return dict(UnitFactory.UNIT_SPECS)
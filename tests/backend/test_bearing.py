@@ -19,6 +19,9 @@ from src.backend.models.common.geometry.bearing import (
     WEST,
 )
 
+# Routed as a group when running under pytest-xdist
+pytestmark = pytest.mark.parallel
+
 def test_bearing_normalization() -> None:
     """Test bearing normalization."""
     # Basic normalization
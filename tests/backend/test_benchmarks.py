@@ -0,0 +1,39 @@
+"""
+Benchmarks for the hot geometry and time paths.
+
+These use pytest-benchmark for calibrated, reproducible timings instead of
+ad-hoc time.perf_counter() loops; run them in isolation with
+``pytest --benchmark-only``. The module skips itself when the plugin is not
+installed so the correctness suite stays runnable without it.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from datetime import datetime, timezone
+from typing import Any
+
+from src.backend.models.common.geometry.haversine import calculate_haversine_distance
+from src.backend.models.common.geometry.position import Position
+from src.backend.models.common.time import GameDuration, GameTime, GameTimeManager
+
+# Routed as a group when running under pytest-xdist
+pytestmark = pytest.mark.serial
+
+SFO = Position(x=-122.3790, y=37.6213)
+JFK = Position(x=-73.7781, y=40.6413)
+
+
+def test_haversine_scalar_bench(benchmark: Any) -> None:
+    """Time one scalar great-circle distance call."""
+    result = benchmark(calculate_haversine_distance, SFO, JFK)
+    assert result.value > 0
+
+
+def test_advance_time_bench(benchmark: Any) -> None:
+    """Time one advance_time step on a live manager."""
+    start = GameTime.from_datetime(datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc))
+    manager = GameTimeManager(start_time=start)
+    one_minute = GameDuration.from_minutes(1)
+    benchmark(manager.advance_time, one_minute)
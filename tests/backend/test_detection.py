@@ -1,4 +1,6 @@
 import pytest
+import numpy as np
+from dataclasses import dataclass, fields
 from unittest.mock import MagicMock, patch
 from typing import cast
 from datetime import datetime, timezone
@@ -10,7 +12,24 @@ from src.backend.models.common import Position
 from src.backend.models.units.types.unit_type import UnitType
 from src.backend.models.common.time.game_time import GameTime
 from src.backend.models.common.time.day_night import DayNightState, DayNightCycle
-from uuid import uuid4
+from tests.backend._ids import next_uuid
+
+# Routed as a group when running under pytest-xdist
+pytestmark = pytest.mark.serial
+
+
+@dataclass(slots=True)
+class _DetectedAttributes:
+    """Just the attribute surface detection reads from a contact."""
+    position: Position
+
+@dataclass(slots=True)
+class DetectionTarget:
+    """Lightweight stand-in for a detected unit; no MagicMock tree needed."""
+    attributes: _DetectedAttributes
+
+def make_target(position: Position) -> DetectionTarget:
+    return DetectionTarget(_DetectedAttributes(position))
 
 @pytest.fixture
 def mock_game_state_manager() -> MagicMock:
@@ -21,7 +40,7 @@ def mock_game_state_manager() -> MagicMock:
 @pytest.fixture
 def unit_instance(mock_game_state_manager: MagicMock) -> Unit:
     attributes = UnitAttributes(
-        unit_id=uuid4(),
+        unit_id=next_uuid(),
         name="Test Unit",
         hull_number="TN-001",
         unit_type=UnitType.DESTROYER,
@@ -42,7 +61,7 @@ def unit_instance(mock_game_state_manager: MagicMock) -> Unit:
         visual_detection_rate=0.8,
         tonnage=5000
     )
-    unit = Unit(**attributes.__dict__)
+    unit = Unit(**{f.name: getattr(attributes, f.name) for f in fields(attributes)})
     detection_module = DetectionModule(unit, mock_game_state_manager)
     unit.add_module('detection', detection_module)
     return unit
@@ -57,13 +76,12 @@ def test_daytime_detection(unit_instance: Unit) -> None:
     current_time = GameTime(datetime(2024, 6, 21, 12, 0, tzinfo=timezone.utc))  # Noon
     
     # Create a target unit within base range
-    target_unit = MagicMock()
-    target_unit.attributes.position = Position(0.1, 0.1)  # Close by
+    target_unit = make_target(Position(0.1, 0.1))  # Close by
     
     with patch.object(detection_module._game_state_manager, 'get_all_units') as mock_get_units:
         mock_get_units.return_value = [unit_instance, target_unit]
-        with patch('src.backend.models.units.modules.detection.calculate_vincenty_distance') as mock_distance:
-            mock_distance.return_value = NauticalMiles(10.0)  # Within base range
+        with patch.object(DetectionModule, '_compute_distances') as mock_distance:
+            mock_distance.return_value = np.array([10.0])  # Within base range
             
             # Mock random to always succeed detection check
             with patch('random.random', return_value=0.0):  # Will be <= any valid detection rate
@@ -85,13 +103,12 @@ def test_night_detection_full_moon(unit_instance: Unit) -> None:
     with patch('src.backend.models.units.modules.detection.DayNightCycle', return_value=mock_cycle):
         
         # Test detection at exactly 5nm
-        target_unit = MagicMock()
-        target_unit.attributes.position = Position(0.1, 0.1)
+        target_unit = make_target(Position(0.1, 0.1))
         
         with patch.object(detection_module._game_state_manager, 'get_all_units') as mock_get_units:
             mock_get_units.return_value = [unit_instance, target_unit]
-            with patch('src.backend.models.units.modules.detection.calculate_vincenty_distance') as mock_distance:
-                mock_distance.return_value = NauticalMiles(5.0)  # At full moon night range
+            with patch.object(DetectionModule, '_compute_distances') as mock_distance:
+                mock_distance.return_value = np.array([5.0])  # At full moon night range
                 
                 # Mock random to always succeed detection check
                 with patch('random.random', return_value=0.0):  # Will be <= any valid detection rate
@@ -113,21 +130,20 @@ def test_night_detection_new_moon(unit_instance: Unit) -> None:
     with patch('src.backend.models.units.modules.detection.DayNightCycle', return_value=mock_cycle):
         
         # Test detection at 1.5nm (should fail) and 0.9nm (should succeed)
-        target_unit = MagicMock()
-        target_unit.attributes.position = Position(0.1, 0.1)
+        target_unit = make_target(Position(0.1, 0.1))
         
         with patch.object(detection_module._game_state_manager, 'get_all_units') as mock_get_units:
             mock_get_units.return_value = [unit_instance, target_unit]
-            with patch('src.backend.models.units.modules.detection.calculate_vincenty_distance') as mock_distance:
+            with patch.object(DetectionModule, '_compute_distances') as mock_distance:
                 # Test beyond new moon range
-                mock_distance.return_value = NauticalMiles(1.5)
+                mock_distance.return_value = np.array([1.5])
                 # Mock random to always succeed detection check (but should still fail due to range)
                 with patch('random.random', return_value=0.0):
                     detected = detection_module.perform_visual_detection(base_rate, base_range, current_time)
                     assert len(detected) == 0, "Should not detect units beyond 1nm during new moon"
                 
                 # Test within new moon range
-                mock_distance.return_value = NauticalMiles(0.9)
+                mock_distance.return_value = np.array([0.9])
                 # Mock random to always succeed detection check
                 with patch('random.random', return_value=0.0):  # Will be <= any valid detection rate
                     detected = detection_module.perform_visual_detection(base_rate, base_range, current_time)
@@ -146,21 +162,20 @@ def test_dawn_dusk_detection(unit_instance: Unit) -> None:
     mock_cycle = MagicMock()
     mock_cycle.get_detection_range.return_value = NauticalMiles(10.0)
     with patch('src.backend.models.units.modules.detection.DayNightCycle', return_value=mock_cycle):
-        target_unit = MagicMock()
-        target_unit.attributes.position = Position(0.1, 0.1)
+        target_unit = make_target(Position(0.1, 0.1))
         
         with patch.object(detection_module._game_state_manager, 'get_all_units') as mock_get_units:
             mock_get_units.return_value = [unit_instance, target_unit]
-            with patch('src.backend.models.units.modules.detection.calculate_vincenty_distance') as mock_distance:
+            with patch.object(DetectionModule, '_compute_distances') as mock_distance:
                 # Test at exactly 10nm
-                mock_distance.return_value = NauticalMiles(10.0)
+                mock_distance.return_value = np.array([10.0])
                 # Mock random to always succeed detection check
                 with patch('random.random', return_value=0.0):  # Will be <= any valid detection rate
                     detected = detection_module.perform_visual_detection(base_rate, base_range, current_time)
                     assert len(detected) > 0, "Should detect units at 10nm during dawn/dusk"
                 
                 # Test beyond 10nm
-                mock_distance.return_value = NauticalMiles(10.1)
+                mock_distance.return_value = np.array([10.1])
                 # Mock random to always succeed detection check (but should still fail due to range)
                 with patch('random.random', return_value=0.0):
                     detected = detection_module.perform_visual_detection(base_rate, base_range, current_time)
@@ -10,48 +10,96 @@ Tests the following:
 - Error handling
 """
 
+import copy
+import functools
 import pytest
+from itertools import combinations
+from unittest.mock import MagicMock
 from datetime import datetime, timezone
-from typing import Generator, Dict, cast
+from typing import Generator, Optional
+import json
+
 from src.backend.models.game_state_manager import GameStateManager, GameState
 from src.backend.models.game.dto import UnitInitialState, MovementOrders, TargetingParameters
 from src.backend.models.common.time import GameTime, GameDuration, GameTimeManager
-from src.backend.models.common.time.time_zone import GameTimeZone
 from src.backend.models.units.types.unit_type import UnitType
+# Only perform_tick is exercised on mock units, so a whitelist mock beats
+# create_autospec, which walks the whole UnitInterface surface. Built once
+# at import; tests reset_mock() instead of reconstructing.
+_UNIT_SPEC_1 = MagicMock(spec_set=["perform_tick"])
+_UNIT_SPEC_2 = MagicMock(spec_set=["perform_tick"])
+
+# Built once at import; every test's time manager starts from this instant.
+_VALID_DT = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
 
+@functools.lru_cache(maxsize=1)
 def get_valid_game_time() -> GameTime:
-    """Helper to get a datetime within valid game bounds."""
-    return GameTime.from_datetime(
-        datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
-    )
+    """Helper to get a datetime within valid game bounds.
+
+    Memoized: GameTime is immutable, so every caller can share one object
+    instead of re-running the datetime validation chain.
+    """
+    return GameTime.from_datetime(_VALID_DT)
+
+@pytest.fixture(scope="module")
+def game_time_manager() -> GameTimeManager:
+    """Shared GameTimeManager with valid time.
+
+    Module-scoped: only tests that merely read the clock should use this
+    directly; tests that advance time take ``fresh_time_manager`` instead.
+    """
+    return GameTimeManager(start_time=get_valid_game_time())
+
+@pytest.fixture
+def fresh_time_manager(game_time_manager: GameTimeManager) -> GameTimeManager:
+    """Per-test copy of the shared time manager for tests that advance time."""
+    return copy.copy(game_time_manager)
+
+@pytest.fixture(scope="module")
+def sample_unit_state() -> UnitInitialState:
+    """Create a sample unit initial state."""
+    return {
+        "position": {"x": 100.0, "y": 200.0},
+        "orientation": 45.0
+    }
 
 class TestGameStateManager:
     """Tests for the GameStateManager class."""
-    
+
     @pytest.fixture(autouse=True)
     def cleanup_singleton(self) -> Generator[None, None, None]:
         """
         Reset the singleton instance before and after each test.
-        
+
         This ensures each test starts with a fresh GameStateManager.
         """
         GameStateManager._instance = None
         yield
         GameStateManager._instance = None
-    
+
     @pytest.fixture
-    def game_time_manager(self) -> GameTimeManager:
-        """Fixture to create GameTimeManager with valid time."""
-        return GameTimeManager(start_time=get_valid_game_time())
-    
+    def manager(self, game_time_manager: GameTimeManager) -> GameStateManager:
+        """Manager built from the shared time manager for read-only tests.
+
+        Function-scoped on purpose: a class-scoped prototype handed out via
+        deepcopy is off the table because the manager graph holds threading
+        primitives (the time manager's Lock, the scheduler's Events), which
+        deepcopy cannot pickle. Construction from the shared time manager is
+        cheap enough that a fresh instance per test costs less than copying.
+        """
+        return GameStateManager(time_manager=game_time_manager)
+
     @pytest.fixture
-    def sample_unit_state(self) -> UnitInitialState:
-        """Create a sample unit initial state."""
-        return {
-            "position": {"x": 100.0, "y": 200.0},
-            "orientation": 45.0
-        }
-    
+    def running_manager(self, fresh_time_manager: GameTimeManager) -> GameStateManager:
+        """Manager already in RUNNING state, scheduler not started.
+
+        Built on the per-test time manager copy because ticking advances the
+        clock; the state poke bypasses start() so no scheduler thread runs.
+        """
+        manager = GameStateManager(time_manager=fresh_time_manager)
+        manager._state = GameState.RUNNING
+        return manager
+
     def test_singleton_pattern(self, game_time_manager: GameTimeManager) -> None:
         """Test that GameStateManager enforces singleton pattern."""
         # First instance should work
@@ -66,53 +114,70 @@ class TestGameStateManager:
         instance2 = GameStateManager.get_instance()
         assert instance2 is instance1
     
-    def test_initial_state(self, game_time_manager: GameTimeManager) -> None:
+    def test_initial_state(self, manager: GameStateManager) -> None:
         """Test initial state of GameStateManager."""
-        manager = GameStateManager(time_manager=game_time_manager)
-        
         # Check initial values
         assert manager.game_state == GameState.INITIALIZING
         assert not manager.is_paused
         assert manager.time_rate == GameStateManager.DEFAULT_TIME_RATE
         assert isinstance(manager.current_time, GameTime)
     
-    def test_time_rate_bounds(self, game_time_manager: GameTimeManager) -> None:
+    @pytest.mark.parametrize("rate,valid", [
+        (GameDuration.from_seconds(0.5), False),   # Below minimum
+        (GameDuration.from_hours(2), False),       # Above maximum
+        (GameStateManager.MIN_TIME_RATE, True),
+        (GameStateManager.MAX_TIME_RATE, True),
+        (GameDuration.from_seconds(1800), True),  # 30 minutes, built without the minutes->seconds multiply
+    ])
+    def test_time_rate_bounds(self, manager: GameStateManager, rate: GameDuration, valid: bool) -> None:
         """Test time rate validation bounds."""
-        manager = GameStateManager(time_manager=game_time_manager)
-        
-        # Test minimum bound
-        with pytest.raises(ValueError, match="Time rate must be between"):
-            manager.set_time_rate(GameDuration.from_seconds(0.5))  # Too small
-        
-        # Test maximum bound
-        with pytest.raises(ValueError, match="Time rate must be between"):
-            manager.set_time_rate(GameDuration.from_hours(2))  # Too large
-        
-        # Test valid values
-        manager.set_time_rate(GameStateManager.MIN_TIME_RATE)  # Should work
-        manager.set_time_rate(GameStateManager.MAX_TIME_RATE)  # Should work
-        manager.set_time_rate(GameDuration.from_minutes(30))  # Should work
+        if valid:
+            manager.set_time_rate(rate)
+            assert manager.time_rate == rate
+        else:
+            with pytest.raises(ValueError, match="Time rate must be between"):
+                manager.set_time_rate(rate)
     
-    def test_time_rate_convenience_methods(self, game_time_manager: GameTimeManager) -> None:
+    @pytest.mark.parametrize("method,value,expected_seconds", [
+        ("set_time_rate_seconds", 30, 30),
+        ("set_time_rate_minutes", 0.5, 30),   # 30 seconds
+        ("set_time_rate_seconds", 0, None),   # Too small
+        ("set_time_rate_minutes", 61, None),  # Too large
+    ])
+    def test_time_rate_convenience_methods(
+        self,
+        manager: GameStateManager,
+        method: str,
+        value: float,
+        expected_seconds: Optional[float],
+    ) -> None:
         """Test the convenience methods for setting time rate."""
-        manager = GameStateManager(time_manager=game_time_manager)
-        
-        # Test seconds
-        manager.set_time_rate_seconds(30)
-        assert manager.time_rate.seconds == 30
-        
-        # Test minutes
-        manager.set_time_rate_minutes(0.5)  # 30 seconds
-        assert manager.time_rate.seconds == 30
-        
-        # Test invalid values
-        with pytest.raises(ValueError):
-            manager.set_time_rate_seconds(0)  # Too small
-        
-        with pytest.raises(ValueError):
-            manager.set_time_rate_minutes(61)  # Too large
+        setter = getattr(manager, method)
+        if expected_seconds is None:
+            with pytest.raises(ValueError):
+                setter(value)
+        else:
+            setter(value)
+            assert manager.time_rate.seconds == expected_seconds
     
-    def test_state_transitions(self, game_time_manager: GameTimeManager) -> None:
+    def test_status_json_caching(self, manager: GameStateManager) -> None:
+        """get_status_json returns the same cached bytes until state changes."""
+        first = manager.get_status_json()
+        status = json.loads(first)
+        assert status["state"] == GameState.INITIALIZING.name
+        assert status["is_paused"] is False
+        assert status["time_rate_seconds"] == GameStateManager.DEFAULT_TIME_RATE.seconds
+        
+        # Repeated polls between state changes reuse the encoded blob
+        assert manager.get_status_json() is first
+        
+        # A time-rate change invalidates the cache and the payload reflects it
+        manager.set_time_rate_seconds(30)
+        second = manager.get_status_json()
+        assert second is not first
+        assert json.loads(second)["time_rate_seconds"] == 30
+
+    def test_state_transitions(self, fresh_time_manager: GameTimeManager) -> None:
         """
         Test game state transitions.
         
@@ -120,7 +185,7 @@ class TestGameStateManager:
         that doesn't affect gameplay. A completed game is done and any attempts to unpause
         will naturally fail with "Game is not paused" since a completed game is not paused.
         """
-        manager = GameStateManager(time_manager=game_time_manager)
+        manager = GameStateManager(time_manager=fresh_time_manager)
         
         # Initial state
         assert manager.game_state == GameState.INITIALIZING
@@ -144,13 +209,11 @@ class TestGameStateManager:
         manager.stop()
         assert manager.game_state == GameState.COMPLETED
     
-    def test_manual_tick(self, game_time_manager: GameTimeManager) -> None:
+    def test_manual_tick(self, running_manager: GameStateManager) -> None:
         """Test manual tick advancement."""
-        manager = GameStateManager(time_manager=game_time_manager)
-        manager.set_time_rate_minutes(1)  # 1 minute per tick
-        
-        # Set state to RUNNING without starting scheduler
-        manager._state = GameState.RUNNING
+        manager = running_manager
+        manager.set_time_rate_seconds(60)  # 1 minute per tick; the minutes
+        # setter path is covered by the convenience-method cases
         initial_time = manager.current_time
         
         # Manually trigger tick
@@ -163,24 +226,6 @@ class TestGameStateManager:
         
         manager.stop()
     
-    def test_game_state_equality(self) -> None:
-        """Test GameState equality comparison."""
-        # Test same states
-        assert GameState.RUNNING == GameState.RUNNING
-        assert GameState.PAUSED == GameState.PAUSED
-        assert GameState.COMPLETED == GameState.COMPLETED
-        assert GameState.INITIALIZING == GameState.INITIALIZING
-        
-        # Test different states
-        assert GameState.RUNNING != GameState.PAUSED
-        assert GameState.PAUSED != GameState.COMPLETED
-        assert GameState.COMPLETED != GameState.INITIALIZING
-        
-        # Test comparison with non-GameState
-        assert GameState.RUNNING != "RUNNING"
-        assert GameState.PAUSED != 2
-        assert GameState.COMPLETED != None
-    
     def test_unit_operations(self, game_time_manager: GameTimeManager, sample_unit_state: UnitInitialState) -> None:
         """Test unit management operations."""
         manager = GameStateManager(time_manager=game_time_manager)
@@ -199,10 +244,8 @@ class TestGameStateManager:
         # Test getting all units (should return empty list)
         assert manager.get_all_units() == []
     
-    def test_unit_movement_and_targeting(self, game_time_manager: GameTimeManager) -> None:
+    def test_unit_movement_and_targeting(self, manager: GameStateManager) -> None:
         """Test unit movement and targeting operations."""
-        manager = GameStateManager(time_manager=game_time_manager)
-        
         # Test movement orders (should raise NotImplementedError)
         movement_orders: MovementOrders = {
             "waypoints": [{"x": 100.0, "y": 200.0}],
@@ -223,23 +266,21 @@ class TestGameStateManager:
         # Ensure GSM does not expose a damage endpoint.
         assert not hasattr(manager, "apply_damage")
     
-    def test_unit_state_updates(self, game_time_manager: GameTimeManager) -> None:
+    def test_unit_state_updates(self, running_manager: GameStateManager) -> None:
         """Test that unit states are properly updated during tick."""
-        from unittest.mock import Mock, create_autospec
-        from src.backend.models.units.unit_interface import UnitInterface
-        
-        manager = GameStateManager(time_manager=game_time_manager)
-        manager._state = GameState.RUNNING
+        manager = running_manager
         
-        # Create properly spec'd mock units with all required methods
-        unit1 = create_autospec(UnitInterface, instance=True)
-        unit2 = create_autospec(UnitInterface, instance=True)
+        # Cached module-level whitelist mocks, cleared of prior call history
+        unit1 = _UNIT_SPEC_1
+        unit2 = _UNIT_SPEC_2
+        unit1.reset_mock()
+        unit2.reset_mock()
         
         # Add mock units to manager's unit list
-        manager._unit_manager._units = {
+        manager._inject_units_for_test({
             "unit1": unit1,
             "unit2": unit2
-        }
+        })
         
         # Trigger a tick
         manager.tick()
@@ -257,9 +298,8 @@ class TestGameStateManager:
         unit1.perform_tick.assert_not_called()
         unit2.perform_tick.assert_not_called()
 
-    def test_time_limit_handling(self, game_time_manager: GameTimeManager) -> None:
+    def test_time_limit_handling(self, manager: GameStateManager) -> None:
         """Test handling of time limit reached error."""
-        manager = GameStateManager(time_manager=game_time_manager)
         manager._state = GameState.RUNNING
         
         # Simulate time limit error
@@ -267,4 +307,26 @@ class TestGameStateManager:
         manager._handle_time_limit_reached(error)
         
         # Check game was stopped
-        assert manager.game_state == GameState.COMPLETED 
\ No newline at end of file
+        assert manager.game_state == GameState.COMPLETED 
+
+class TestGameState:
+    """Pure enum tests; kept outside TestGameStateManager so the autouse
+    singleton cleanup does not run for tests that never touch the singleton."""
+
+    def test_game_state_equality(self) -> None:
+        """Test GameState equality comparison."""
+        # Test same states
+        assert GameState.RUNNING == GameState.RUNNING
+        assert GameState.PAUSED == GameState.PAUSED
+        assert GameState.COMPLETED == GameState.COMPLETED
+        assert GameState.INITIALIZING == GameState.INITIALIZING
+        
+        # Test different states: one pass over the 6 distinct pairs covers
+        # every combination the old hand-written asserts sampled from
+        for state_a, state_b in combinations(GameState, 2):
+            assert state_a != state_b
+        
+        # Test comparison with non-GameState
+        assert GameState.RUNNING != "RUNNING"
+        assert GameState.PAUSED != 2
+        assert GameState.COMPLETED != None
@@ -8,15 +8,20 @@ Tests the following:
 """
 
 import pytest
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from typing import cast
-from src.backend.models.common.time import GameTime, GameDuration, GameTimeManager, GameTimeZone
+from src.backend.models.common.time import GameTime, GameDuration, GameTimeManager
 
-def get_valid_game_time() -> GameTime:
-    """Helper to get a valid game time."""
-    return GameTime.from_datetime(
-        datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)  # Mid-2024
-    )
+# Shared instants, built once at import instead of per test; the shared
+# GameTime itself comes from the session-scoped valid_game_time fixture
+_VALID_DT = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)  # Mid-2024
+_DT_2024_01_01_UTC = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_DT_2024_01_02_UTC = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+# GameTime is immutable, so comparison tests can share converted instants
+# rather than re-running from_datetime validation per test
+_GT_2024_01_01 = GameTime.from_datetime(_DT_2024_01_01_UTC)
+_GT_2024_01_02 = GameTime.from_datetime(_DT_2024_01_02_UTC)
 
 class TestGameDuration:
     """Tests for the GameDuration class."""
@@ -65,7 +70,7 @@ class TestGameTime:
     def test_creation_and_validation(self) -> None:
         """Test creating GameTime with validation."""
         # Valid time
-        valid_dt = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+        valid_dt = _VALID_DT
         game_time = GameTime.from_datetime(valid_dt)
         assert game_time.to_datetime() == valid_dt
         
@@ -83,9 +88,9 @@ class TestGameTime:
     
     def test_time_comparisons(self) -> None:
         """Test time comparison operations."""
-        time1 = GameTime.from_datetime(datetime(2024, 1, 1, tzinfo=timezone.utc))
-        time2 = GameTime.from_datetime(datetime(2024, 1, 2, tzinfo=timezone.utc))
-        time3 = GameTime.from_datetime(datetime(2024, 1, 1, tzinfo=timezone.utc))
+        time1 = _GT_2024_01_01
+        time2 = _GT_2024_01_02
+        time3 = GameTime.from_datetime(_DT_2024_01_01_UTC)  # Distinct object, equal value
         
         # Equality
         assert time1 == time3
@@ -109,20 +114,27 @@ class TestGameTime:
         assert time1 >= time3
         assert not (time1 >= time2)
 
+@pytest.fixture(scope="class")
+def manager(valid_game_time: GameTime) -> GameTimeManager:
+    """One manager per test class; tests reset_to() their start instant.
+
+    Construction is shared because every test here fully establishes the
+    clock state it needs via reset_to before advancing.
+    """
+    return GameTimeManager(start_time=valid_game_time)
+
 class TestGameTimeManager:
     """Tests for the GameTimeManager class."""
-    
-    def test_initialization(self) -> None:
+
+    def test_initialization(self, manager: GameTimeManager, valid_game_time: GameTime) -> None:
         """Test GameTimeManager initialization."""
         # Test with specific start time
-        start_time = get_valid_game_time()
-        manager = GameTimeManager(start_time)
-        assert manager.time_now == start_time
+        manager.reset_to(valid_game_time)
+        assert manager.time_now == valid_game_time
     
-    def test_time_advancement(self) -> None:
+    def test_time_advancement(self, manager: GameTimeManager, valid_game_time: GameTime) -> None:
         """Test advancing time by different durations."""
-        start_time = get_valid_game_time()
-        manager = GameTimeManager(start_time)
+        manager.reset_to(valid_game_time)
         
         # Advance by 5 minutes
         five_min = GameDuration.from_minutes(5)
@@ -134,11 +146,15 @@ class TestGameTimeManager:
         new_time = manager.advance_time(one_hour)
         assert new_time.to_datetime().hour == 13
         assert new_time.to_datetime().minute == 5
+        
+        # advance_time returns the very object it stored: one GameTime is
+        # allocated per advance, not a stored copy plus a returned copy
+        assert new_time is manager.time_now
     
-    def test_time_consistency(self) -> None:
+    def test_time_consistency(self, manager: GameTimeManager, valid_game_time: GameTime) -> None:
         """Test that time advances consistently and maintains state."""
-        start_time = get_valid_game_time()
-        manager = GameTimeManager(start_time)
+        start_time = valid_game_time
+        manager.reset_to(start_time)
         
         # Make multiple time advancements
         one_min = GameDuration.from_minutes(1)
@@ -0,0 +1,118 @@
+"""
+Tests for the haversine great-circle distance module.
+
+Expected distances are published great-circle figures for well-known
+airport pairs, so the assertions are independent of the implementation.
+Position convention: x is longitude, y is latitude, decimal degrees.
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+import pytest
+from src.backend.models.common.geometry.haversine import (
+    EARTH_RADIUS_NM,
+    _haversine_rad,
+    calculate_haversine_distance,
+    calculate_haversine_distance_batch,
+)
+from src.backend.models.common.geometry.haversine_gpu import haversine_matrix
+from src.backend.models.common.geometry.position import Position
+
+# Routed as a group when running under pytest-xdist
+pytestmark = pytest.mark.parallel
+
+# Airport reference positions (lon, lat in decimal degrees)
+SFO = Position(x=-122.3790, y=37.6213)
+JFK = Position(x=-73.7781, y=40.6413)
+LAX = Position(x=-118.4085, y=33.9416)
+SEA = Position(x=-122.3088, y=47.4502)
+
+# Radian forms precomputed at import for the radian-helper assertions
+SFO_RAD = (math.radians(SFO.y), math.radians(SFO.x))
+JFK_RAD = (math.radians(JFK.y), math.radians(JFK.x))
+LAX_RAD = (math.radians(LAX.y), math.radians(LAX.x))
+SEA_RAD = (math.radians(SEA.y), math.radians(SEA.x))
+
+# (origin, destination, published great-circle distance in nm)
+AIRPORT_PAIRS = [
+    (SFO, JFK, 2241.9),
+    (SFO, LAX, 293.6),
+    (SEA, LAX, 830.0),
+    (SEA, JFK, 2098.6),
+]
+
+@pytest.mark.parametrize("origin,destination,expected_nm", AIRPORT_PAIRS)
+def test_airport_distances(origin: Position, destination: Position, expected_nm: float) -> None:
+    """Scalar distances match published figures within spherical-model error."""
+    distance = calculate_haversine_distance(origin, destination)
+    assert abs(distance.value - expected_nm) < expected_nm * 0.005
+
+@pytest.mark.parametrize("origin,destination,expected_nm", AIRPORT_PAIRS)
+def test_symmetrical_distances(origin: Position, destination: Position, expected_nm: float) -> None:
+    """Distance is direction-independent."""
+    forward = calculate_haversine_distance(origin, destination)
+    reverse = calculate_haversine_distance(destination, origin)
+    assert abs(forward.value - reverse.value) < 1e-9
+
+def test_zero_distance() -> None:
+    """A position is at zero distance from itself."""
+    assert calculate_haversine_distance(SFO, SFO).value == 0.0
+
+def test_antipodal_distance() -> None:
+    """Antipodal points are half the earth's circumference apart."""
+    north = Position(x=0.0, y=90.0)
+    south = Position(x=0.0, y=-90.0)
+    half_circumference = np.pi * EARTH_RADIUS_NM
+    distance = calculate_haversine_distance(north, south)
+    assert abs(distance.value - half_circumference) < 1e-6
+
+@pytest.mark.parametrize("origin_rad,target_rad,origin,target", [
+    (SFO_RAD, JFK_RAD, SFO, JFK),
+    (SEA_RAD, LAX_RAD, SEA, LAX),
+])
+def test_radian_helper_matches_public(
+    origin_rad: Tuple[float, float],
+    target_rad: Tuple[float, float],
+    origin: Position,
+    target: Position,
+) -> None:
+    """The radian fast path agrees with the degree-based public API."""
+    via_rad = _haversine_rad(*origin_rad, *target_rad)
+    via_public = calculate_haversine_distance(origin, target)
+    assert abs(via_rad - via_public.value) < 1e-9
+
+def test_batch_matches_scalar() -> None:
+    """One vectorized pass agrees with per-pair scalar calls."""
+    origins = np.array([p.y for p, _, _ in AIRPORT_PAIRS])
+    origin_lons = np.array([p.x for p, _, _ in AIRPORT_PAIRS])
+    targets = np.array([p.y for _, p, _ in AIRPORT_PAIRS])
+    target_lons = np.array([p.x for _, p, _ in AIRPORT_PAIRS])
+
+    batch = calculate_haversine_distance_batch(origins, origin_lons, targets, target_lons)
+    scalar = np.array([
+        calculate_haversine_distance(a, b).value for a, b, _ in AIRPORT_PAIRS
+    ])
+    assert batch.shape == (len(AIRPORT_PAIRS),)
+    assert np.abs(batch - scalar).max() < 1e-9
+
+def test_batch_broadcasts_observer() -> None:
+    """A scalar observer broadcasts against an array of targets."""
+    targets_lat = np.array([JFK.y, LAX.y, SEA.y])
+    targets_lon = np.array([JFK.x, LAX.x, SEA.x])
+    distances = calculate_haversine_distance_batch(SFO.y, SFO.x, targets_lat, targets_lon)
+    expected = np.array([
+        calculate_haversine_distance(SFO, p).value for p in (JFK, LAX, SEA)
+    ])
+    assert np.abs(distances - expected).max() < 1e-9
+
+def test_matrix_matches_scalar() -> None:
+    """The N x M sweep agrees with per-pair scalar calls (CPU fallback path)."""
+    sources = [SFO, SEA]
+    targets = [JFK, LAX, SEA]
+    matrix = haversine_matrix(sources, targets)
+    assert matrix.shape == (2, 3)
+    for i, src in enumerate(sources):
+        for j, dst in enumerate(targets):
+            assert abs(matrix[i, j] - calculate_haversine_distance(src, dst).value) < 1e-9
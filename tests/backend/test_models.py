@@ -1,15 +1,22 @@
 """
 Tests for the game models type definitions.
 """
-from typing import Dict, Any, cast
+from typing import Any, Callable, Dict, cast
 import pytest
 from src.backend.models.common import Position
 from src.backend.models import PlayerState, GameState
 
 @pytest.mark.unit
-def test_position_type_creation(sample_position: Dict[str, int]) -> None:
-    """Test that Position can be created with correct types."""
-    position = Position(x=sample_position["x"], y=sample_position["y"])
+@pytest.mark.parametrize("factory", [
+    lambda s: Position(x=s["x"], y=s["y"]),
+    lambda s: Position.from_tuple((s["x"], s["y"])),
+], ids=["kwargs", "from_tuple"])
+def test_position_type_creation(
+    sample_position: Dict[str, int],
+    factory: Callable[[Dict[str, int]], Position],
+) -> None:
+    """Test that Position can be created through either construction idiom."""
+    position = factory(sample_position)
     assert isinstance(position.x, int)
     assert isinstance(position.y, int)
 
@@ -2,36 +2,43 @@
 
 import math
 import pytest
-from uuid import uuid4
+from dataclasses import replace
 
 from src.backend.models.common.geometry import Position, NauticalMiles, Bearing
 from src.backend.models.units import UnitAttributes
 from src.backend.models.units.types.unit_type import UnitType
-from src.backend.models.units.modules.movement import MovementModule
+from src.backend.models.units.modules.movement import MovementModule, advance_all
+
+from tests.backend._approx import close
+from tests.backend._ids import next_uuid
+
+# One fully-built template; fixtures hand out per-test copies via
+# dataclasses.replace instead of re-running construction and uuid4 each time
+_TEMPLATE_ATTRIBUTES = UnitAttributes(
+    unit_id=next_uuid(),
+    name="Test Ship",
+    hull_number="TST-001",
+    unit_type=UnitType.DESTROYER,
+    task_force_assigned_to=None,
+    ship_class="Test Class",
+    faction="TEST",
+    position=Position(0.0, 0.0),
+    destination=None,
+    max_speed=NauticalMiles(30.0),
+    cruise_speed=NauticalMiles(15.0),
+    current_speed=NauticalMiles(0.0),
+    max_health=100.0,
+    current_health=100.0,
+    max_fuel=1000.0,
+    current_fuel=1000.0,
+    crew=100,
+    tonnage=1000
+)
 
 @pytest.fixture
 def test_unit_attributes() -> UnitAttributes:
     """Create test unit attributes."""
-    return UnitAttributes(
-        unit_id=uuid4(),
-        name="Test Ship",
-        hull_number="TST-001",
-        unit_type=UnitType.DESTROYER,
-        task_force_assigned_to=None,
-        ship_class="Test Class",
-        faction="TEST",
-        position=Position(0.0, 0.0),
-        destination=None,
-        max_speed=NauticalMiles(30.0),
-        cruise_speed=NauticalMiles(15.0),
-        current_speed=NauticalMiles(0.0),
-        max_health=100.0,
-        current_health=100.0,
-        max_fuel=1000.0,
-        current_fuel=1000.0,
-        crew=100,
-        tonnage=1000
-    )
+    return replace(_TEMPLATE_ATTRIBUTES)
 
 @pytest.fixture
 def movement_module(test_unit_attributes: UnitAttributes) -> MovementModule:
@@ -83,39 +90,30 @@ def test_stop(movement_module: MovementModule) -> None:
 def test_straight_movement(movement_module: MovementModule) -> None:
     """Test moving in a straight line."""
     # Set up movement north at 10 knots
-    movement_module.set_destination(Position(0.0, 10.0))
-    movement_module.set_speed(NauticalMiles(10.0))
-
-    # Move for 1 time unit
+    movement_module.engage(Position(0.0, 10.0), NauticalMiles(10.0))
     movement_module.update(1.0)
 
     # Should have moved 10 units north
-    assert math.isclose(movement_module.unit_attributes.position.y, 10.0, rel_tol=1e-10)
-    assert math.isclose(movement_module.unit_attributes.position.x, 0.0, rel_tol=1e-10)
+    assert close(movement_module.unit_attributes.position.y, 10.0)
+    assert close(movement_module.unit_attributes.position.x, 0.0)
 
 def test_diagonal_movement(movement_module: MovementModule) -> None:
     """Test moving diagonally."""
     # Set up diagonal movement at 10 knots
     expected_x = 7.071067811865475  # 10 * sin(45°)
     expected_y = 7.071067811865475  # 10 * cos(45°)
-    movement_module.set_destination(Position(10.0, 10.0))
-    movement_module.set_speed(NauticalMiles(10.0))
-
-    # Move for 1 time unit
+    movement_module.engage(Position(10.0, 10.0), NauticalMiles(10.0))
     movement_module.update(1.0)
 
     # Should have moved equal distance in x and y
-    assert math.isclose(movement_module.unit_attributes.position.x, expected_x, rel_tol=1e-10)
-    assert math.isclose(movement_module.unit_attributes.position.y, expected_y, rel_tol=1e-10)
+    assert close(movement_module.unit_attributes.position.x, expected_x)
+    assert close(movement_module.unit_attributes.position.y, expected_y)
 
 def test_reach_destination_exact(movement_module: MovementModule) -> None:
     """Test reaching destination exactly."""
     # Set up movement north at 10 knots
     dest = Position(0.0, 10.0)
-    movement_module.set_destination(dest)
-    movement_module.set_speed(NauticalMiles(10.0))
-
-    # Move for 1 time unit - should reach destination exactly
+    movement_module.engage(dest, NauticalMiles(10.0))
     movement_module.update(1.0)
 
     assert movement_module.unit_attributes.position == dest
@@ -125,10 +123,7 @@ def test_reach_destination_shorter(movement_module: MovementModule) -> None:
     """Test reaching destination when it's closer than what we could travel."""
     # Set up movement north at 10 knots
     dest = Position(0.0, 5.0)  # 5 units north
-    movement_module.set_destination(dest)
-    movement_module.set_speed(NauticalMiles(10.0))
-
-    # Move for 1 time unit - should reach destination and stop early
+    movement_module.engage(dest, NauticalMiles(10.0))
     movement_module.update(1.0)
 
     assert movement_module.unit_attributes.position == dest
@@ -157,93 +152,110 @@ def test_no_movement_at_zero_speed(movement_module: MovementModule) -> None:
 def test_half_speed_movement(movement_module: MovementModule) -> None:
     """Test movement at half normal time rate (30 seconds)."""
     # Set up movement north at 10 knots
-    movement_module.set_destination(Position(0.0, 10.0))
-    movement_module.set_speed(NauticalMiles(10.0))
-
-    # Move for 0.5 time units (30 seconds)
+    movement_module.engage(Position(0.0, 10.0), NauticalMiles(10.0))
     movement_module.update(0.5)
 
     # Should have moved 5 units north (half of normal movement)
-    assert math.isclose(movement_module.unit_attributes.position.y, 5.0, rel_tol=1e-10)
-    assert math.isclose(movement_module.unit_attributes.position.x, 0.0, rel_tol=1e-10)
+    assert close(movement_module.unit_attributes.position.y, 5.0)
+    assert close(movement_module.unit_attributes.position.x, 0.0)
 
 def test_double_speed_movement(movement_module: MovementModule) -> None:
     """Test movement at double normal time rate (2 minutes)."""
     # Set up movement north at 10 knots
-    movement_module.set_destination(Position(0.0, 20.0))
-    movement_module.set_speed(NauticalMiles(10.0))
-
-    # Move for 2.0 time units (2 minutes)
+    movement_module.engage(Position(0.0, 20.0), NauticalMiles(10.0))
     movement_module.update(2.0)
 
     # Should have moved 20 units north (double normal movement)
-    assert math.isclose(movement_module.unit_attributes.position.y, 20.0, rel_tol=1e-10)
-    assert math.isclose(movement_module.unit_attributes.position.x, 0.0, rel_tol=1e-10)
+    assert close(movement_module.unit_attributes.position.y, 20.0)
+    assert close(movement_module.unit_attributes.position.x, 0.0)
 
 def test_very_slow_movement(movement_module: MovementModule) -> None:
     """Test movement at very slow time rate (6 seconds)."""
     # Set up movement north at 10 knots
-    movement_module.set_destination(Position(0.0, 10.0))
-    movement_module.set_speed(NauticalMiles(10.0))
-
-    # Move for 0.1 time units (6 seconds)
+    movement_module.engage(Position(0.0, 10.0), NauticalMiles(10.0))
     movement_module.update(0.1)
 
     # Should have moved 1 unit north (1/10th of normal movement)
-    assert math.isclose(movement_module.unit_attributes.position.y, 1.0, rel_tol=1e-10)
-    assert math.isclose(movement_module.unit_attributes.position.x, 0.0, rel_tol=1e-10)
+    assert close(movement_module.unit_attributes.position.y, 1.0)
+    assert close(movement_module.unit_attributes.position.x, 0.0)
 
 def test_very_fast_movement(movement_module: MovementModule) -> None:
     """Test movement at very fast time rate (5 minutes)."""
     # Set up movement north at 10 knots
-    movement_module.set_destination(Position(0.0, 50.0))
-    movement_module.set_speed(NauticalMiles(10.0))
-
-    # Move for 5.0 time units (5 minutes)
+    movement_module.engage(Position(0.0, 50.0), NauticalMiles(10.0))
     movement_module.update(5.0)
 
     # Should have moved 50 units north (5x normal movement)
-    assert math.isclose(movement_module.unit_attributes.position.y, 50.0, rel_tol=1e-10)
-    assert math.isclose(movement_module.unit_attributes.position.x, 0.0, rel_tol=1e-10)
+    assert close(movement_module.unit_attributes.position.y, 50.0)
+    assert close(movement_module.unit_attributes.position.x, 0.0)
 
 def test_diagonal_movement_at_different_speeds(movement_module: MovementModule) -> None:
     """Test diagonal movement at different time rates."""
     # Test half speed (30 seconds)
-    movement_module.set_destination(Position(10.0, 10.0))
-    movement_module.set_speed(NauticalMiles(10.0))
+    movement_module.engage(Position(10.0, 10.0), NauticalMiles(10.0))
     movement_module.update(0.5)
 
     expected_x = 3.535533905932738  # 5 * sin(45°)
     expected_y = 3.535533905932738  # 5 * cos(45°)
-    assert math.isclose(movement_module.unit_attributes.position.x, expected_x, rel_tol=1e-10)
-    assert math.isclose(movement_module.unit_attributes.position.y, expected_y, rel_tol=1e-10)
+    assert close(movement_module.unit_attributes.position.x, expected_x)
+    assert close(movement_module.unit_attributes.position.y, expected_y)
 
     # Test double speed (2 minutes) with new destination
     movement_module.unit_attributes.position = Position(0.0, 0.0)  # Reset position
-    movement_module.set_destination(Position(20.0, 20.0))  # Set new destination
-    movement_module.set_speed(NauticalMiles(10.0))  # Ensure speed is set
+    movement_module.engage(Position(20.0, 20.0), NauticalMiles(10.0))
     movement_module.update(2.0)
 
     expected_x = 14.142135623730951  # 20 * sin(45°)
     expected_y = 14.142135623730951  # 20 * cos(45°)
-    assert math.isclose(movement_module.unit_attributes.position.x, expected_x, rel_tol=1e-10)
-    assert math.isclose(movement_module.unit_attributes.position.y, expected_y, rel_tol=1e-10)
+    assert close(movement_module.unit_attributes.position.x, expected_x)
+    assert close(movement_module.unit_attributes.position.y, expected_y)
 
 def test_continuous_movement_at_different_speeds(movement_module: MovementModule) -> None:
     """Test continuous movement with changing time rates."""
     # Set up movement north at 10 knots
-    movement_module.set_destination(Position(0.0, 100.0))  # Far destination
-    movement_module.set_speed(NauticalMiles(10.0))
-
-    # Move at different speeds and verify positions
+    movement_module.engage(Position(0.0, 100.0), NauticalMiles(10.0))
     movement_module.update(0.5)  # 30 seconds
-    assert math.isclose(movement_module.unit_attributes.position.y, 5.0, rel_tol=1e-10)
+    assert close(movement_module.unit_attributes.position.y, 5.0)
 
     movement_module.update(1.0)  # 1 minute
-    assert math.isclose(movement_module.unit_attributes.position.y, 15.0, rel_tol=1e-10)
+    assert close(movement_module.unit_attributes.position.y, 15.0)
 
     movement_module.update(2.0)  # 2 minutes
-    assert math.isclose(movement_module.unit_attributes.position.y, 35.0, rel_tol=1e-10)
+    assert close(movement_module.unit_attributes.position.y, 35.0)
 
     movement_module.update(0.1)  # 6 seconds
-    assert math.isclose(movement_module.unit_attributes.position.y, 36.0, rel_tol=1e-10) 
\ No newline at end of file
+    assert close(movement_module.unit_attributes.position.y, 36.0) 
+
+def _make_module(position: Position) -> MovementModule:
+    """Build a bound movement module for the batch parity test."""
+    attributes = replace(
+        _TEMPLATE_ATTRIBUTES,
+        name="Batch Ship",
+        hull_number="BTC-001",
+        position=position,
+    )
+    module = MovementModule()
+    module.bind_unit_attributes(attributes)
+    return module
+
+def test_advance_all_matches_scalar_updates() -> None:
+    """The vectorized fleet pass agrees with per-module update calls."""
+    starts = [Position(0.0, 0.0), Position(1.0, 1.0), Position(-2.0, 0.5)]
+    destinations = [Position(3.0, 4.0), Position(1.0, 2.0), Position(-2.0, 0.6)]
+    speeds = [NauticalMiles(10.0), NauticalMiles(20.0), NauticalMiles(5.0)]
+
+    scalar_modules = [_make_module(p) for p in starts]
+    batch_modules = [_make_module(p) for p in starts]
+    for group in (scalar_modules, batch_modules):
+        for module, destination, speed in zip(group, destinations, speeds):
+            module.engage(destination, speed)
+
+    for _ in range(4):
+        for module in scalar_modules:
+            module.update(0.5)
+        advance_all(batch_modules, 0.5)
+
+    for scalar, batch in zip(scalar_modules, batch_modules):
+        assert scalar._state.is_moving == batch._state.is_moving
+        assert abs(scalar.unit_attributes.position.x - batch.unit_attributes.position.x) < 1e-9
+        assert abs(scalar.unit_attributes.position.y - batch.unit_attributes.position.y) < 1e-9
@@ -9,9 +9,11 @@ Tests the following:
 - Factory methods
 """
 
-import dataclasses
+from dataclasses import FrozenInstanceError
+from typing import Optional
+
 import pytest
-from datetime import timezone, timedelta
+from datetime import timezone
 from src.backend.models.common.time.time_zone import (
     GameTimeZone,
     UTC,
@@ -21,79 +23,63 @@ from src.backend.models.common.time.time_zone import (
     GMT,
 )
 
+# Frozen-dataclass setattr raises regardless of which instance is poked,
+# so one module-level instance serves every immutability case.
+_IMMUTABLE_ZONE = GameTimeZone(1, "Test")
+
 class TestGameTimeZone:
     """Tests for the GameTimeZone class."""
     
-    def test_creation_and_properties(self) -> None:
+    @pytest.mark.parametrize("offset,name", [
+        (-5, "EST"),
+        (-3, None),
+        (2, "EET"),   # Eastern European Time
+        (0, None),
+    ])
+    def test_creation_and_properties(self, offset: float, name: Optional[str]) -> None:
         """Test creating time zones and accessing their properties."""
-        # Test with name
-        est = GameTimeZone(-5, "EST")
-        assert est.offset_hours == -5
-        assert est.name == "EST"
-        
-        # Test without name
-        minus_three = GameTimeZone(-3)
-        assert minus_three.offset_hours == -3
-        assert minus_three.name is None
-        
-        # Test positive offset
-        plus_two = GameTimeZone(2, "EET")  # Eastern European Time
-        assert plus_two.offset_hours == 2
-        assert plus_two.name == "EET"
-        
-        # Test zero offset
-        utc = GameTimeZone(0)
-        assert utc.offset_hours == 0
-        assert utc.name is None
+        zone = GameTimeZone(offset, name)
+        assert zone.offset_hours == offset
+        assert zone.name == name
     
-    def test_to_timezone_conversion(self) -> None:
-        """Test conversion to Python's timezone."""
-        # Test positive offset
-        plus_one = GameTimeZone(1, "CET")
-        tz = plus_one.to_timezone()
+    @pytest.mark.parametrize("offset,name,expected_seconds", [
+        (1, "CET", 3600),
+        (-8, "PST", -28800),
+        (0, "UTC", 0),
+        (5.5, "IST", 19800),  # Indian Standard Time
+    ])
+    def test_to_timezone_conversion(
+        self, offset: float, name: str, expected_seconds: int
+    ) -> None:
+        """Test conversion to Python's timezone.
+
+        Compares via total_seconds() against exact integers rather than
+        building an expected timedelta, so the assertion is a single number
+        compare with no hidden float normalization in timedelta.__eq__.
+        """
+        tz = GameTimeZone(offset, name).to_timezone()
         assert isinstance(tz, timezone)
-        assert tz.utcoffset(None) == timedelta(hours=1)
-        
-        # Test negative offset
-        minus_eight = GameTimeZone(-8, "PST")
-        tz = minus_eight.to_timezone()
-        assert tz.utcoffset(None) == timedelta(hours=-8)
-        
-        # Test zero offset
-        utc = GameTimeZone(0, "UTC")
-        tz = utc.to_timezone()
-        assert tz.utcoffset(None) == timedelta(0)
-        
-        # Test fractional offset
-        half_hour = GameTimeZone(5.5, "IST")  # Indian Standard Time
-        tz = half_hour.to_timezone()
-        assert tz.utcoffset(None) == timedelta(hours=5, minutes=30)
+        utc_offset = tz.utcoffset(None)
+        assert utc_offset is not None
+        assert utc_offset.total_seconds() == expected_seconds
     
-    def test_string_representation(self) -> None:
+    @pytest.mark.parametrize("offset,name,expected", [
+        # Named zones
+        (-5, "EST", "EST"),
+        (0, "UTC", "UTC"),
+        # Unnamed zones
+        (3, None, "UTC+3"),
+        (-4, None, "UTC-4"),
+        (0, None, "UTC+0"),
+        # Fractional offsets
+        (5.5, None, "UTC+5.5"),
+        (-3.75, None, "UTC-3.75"),
+    ], ids=["EST", "UTC", "+3", "-4", "+0", "+5.5", "-3.75"])
+    def test_string_representation(
+        self, offset: float, name: Optional[str], expected: str
+    ) -> None:
         """Test string conversion of time zones."""
-        # Test named zones
-        est = GameTimeZone(-5, "EST")
-        assert str(est) == "EST"
-        
-        utc = GameTimeZone(0, "UTC")
-        assert str(utc) == "UTC"
-        
-        # Test unnamed zones
-        plus_three = GameTimeZone(3)
-        assert str(plus_three) == "UTC+3"
-        
-        minus_four = GameTimeZone(-4)
-        assert str(minus_four) == "UTC-4"
-        
-        zero = GameTimeZone(0)
-        assert str(zero) == "UTC+0"
-        
-        # Test fractional offsets
-        half_hour = GameTimeZone(5.5)
-        assert str(half_hour) == "UTC+5.5"
-        
-        quarter_hour = GameTimeZone(-3.75)
-        assert str(quarter_hour) == "UTC-3.75"
+        assert str(GameTimeZone(offset, name)) == expected
     
     def test_factory_methods(self) -> None:
         """Test the factory methods for creating time zones."""
@@ -114,34 +100,25 @@ class TestGameTimeZone:
         assert plus_four.name is None
         assert str(plus_four) == "UTC+4"
     
-    def test_predefined_zones(self) -> None:
+    @pytest.mark.parametrize("zone,expected_offset,expected_name", [
+        (UTC, 0, "UTC"),
+        (EST, -5, "EST"),
+        (CST, -6, "CST"),
+        (PST, -8, "PST"),
+        (GMT, 0, "GMT"),
+    ], ids=["UTC", "EST", "CST", "PST", "GMT"])
+    def test_predefined_zones(
+        self, zone: GameTimeZone, expected_offset: float, expected_name: str
+    ) -> None:
         """Test the predefined time zone constants."""
-        # Test UTC
-        assert UTC.offset_hours == 0
-        assert UTC.name == "UTC"
-        
-        # Test EST
-        assert EST.offset_hours == -5
-        assert EST.name == "EST"
-        
-        # Test CST
-        assert CST.offset_hours == -6
-        assert CST.name == "CST"
-        
-        # Test PST
-        assert PST.offset_hours == -8
-        assert PST.name == "PST"
-        
-        # Test GMT
-        assert GMT.offset_hours == 0
-        assert GMT.name == "GMT"
+        assert zone.offset_hours == expected_offset
+        assert zone.name == expected_name
     
-    def test_immutability(self) -> None:
+    @pytest.mark.parametrize("attribute,value", [
+        ("_offset_hours", 2),
+        ("_name", "Changed"),
+    ])
+    def test_immutability(self, attribute: str, value: object) -> None:
         """Test that GameTimeZone instances are immutable."""
-        zone = GameTimeZone(1, "Test")
-        
-        with pytest.raises(dataclasses.FrozenInstanceError):
-            zone._offset_hours = 2  # type: ignore
-        
-        with pytest.raises(dataclasses.FrozenInstanceError):
-            zone._name = "Changed"  # type: ignore 
\ No newline at end of file
+        with pytest.raises(FrozenInstanceError):
+            setattr(_IMMUTABLE_ZONE, attribute, value) 
\ No newline at end of file
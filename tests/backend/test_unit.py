@@ -1,6 +1,10 @@
+import copy
+
 import pytest
-from typing import Optional
-from uuid import UUID, uuid4
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from tests.backend._ids import next_uuid
 
 from src.backend.models.common import Position
 from src.backend.models.common.geometry.nautical_miles import NauticalMiles
@@ -8,56 +12,90 @@ from src.backend.models.units import Unit, UnitAttributes
 from src.backend.models.units.types import UnitType
 from src.backend.models.units import UnitModule
 
+# Common positions and speed values interned once; Position and
+# NauticalMiles are immutable, so tests and fixtures can share instances.
+_ORIGIN = Position(x=0.0, y=0.0)
+_P10 = Position(x=10.0, y=10.0)
+_P100 = Position(x=100.0, y=100.0)
+_P200 = Position(x=200.0, y=200.0)
+_NM_ZERO = NauticalMiles.ZERO
+_NM_15 = NauticalMiles(15.0)
+_NM_20 = NauticalMiles(20.0)
+
+# Canonical keyword template for Unit construction: the fixtures state only
+# what differs from it. Unit builds its own UnitAttributes internally, so
+# the template is a kwargs dict rather than a dataclasses.replace base.
+_UNIT_TEMPLATE: Dict[str, Any] = dict(
+    task_force_assigned_to=None,
+    faction="USN",
+    position=_ORIGIN,
+    destination=None,
+    cruise_speed=_NM_15,
+    current_speed=_NM_ZERO,
+)
+
+@pytest.fixture(scope="module")
+def basic_unit() -> Unit:
+    """A basic unit built once per module; mutating tests use mutable_unit."""
+    return Unit(
+        unit_id=next_uuid(),
+        name="Test Destroyer",
+        hull_number="DD-445",
+        unit_type=UnitType.DESTROYER,
+        ship_class="Fletcher",
+        max_speed=NauticalMiles(30.0),
+        max_health=100.0,
+        current_health=100.0,
+        max_fuel=1000.0,
+        current_fuel=1000.0,
+        crew=273,
+        tonnage=2100,
+        **_UNIT_TEMPLATE
+    )
+
+@pytest.fixture(scope="module")
+def task_force_unit() -> Unit:
+    """A unit assigned to a task force, built once per module (read-only)."""
+    return Unit(
+        unit_id=next_uuid(),
+        name="Task Force Ship",
+        hull_number="CA-68",
+        unit_type=UnitType.CRUISER,
+        ship_class="Baltimore",
+        max_speed=NauticalMiles(25.0),
+        max_health=150.0,
+        current_health=150.0,
+        max_fuel=1200.0,
+        current_fuel=1200.0,
+        crew=1142,
+        tonnage=13600,
+        **{**_UNIT_TEMPLATE, "task_force_assigned_to": "TF-38", "position": _P10}
+    )
+
+class _ProbeModule(UnitModule):
+    """Minimal module recording initialization, shared by module tests.
+
+    Defined at module scope so class construction happens once per process
+    instead of on every test run.
+    """
+    def __init__(self) -> None:
+        self.initialized = False
+
+    def initialize(self) -> None:
+        self.initialized = True
+
+@pytest.fixture
+def mutable_unit(basic_unit: Unit) -> Unit:
+    """A private copy of basic_unit for tests that mutate state.
+
+    Goes through Unit.__copy__, which flat-copies the attribute dataclass
+    and rebinds the attack module -- far cheaper than either deepcopy's
+    reflective walk or re-running the full Unit construction per test.
+    """
+    return copy.copy(basic_unit)
+
 class TestUnit:
     """Test suite for the Unit class"""
-    
-    @pytest.fixture
-    def basic_unit(self) -> Unit:
-        """Fixture providing a basic unit for testing"""
-        return Unit(
-            unit_id=uuid4(),
-            name="Test Destroyer",
-            hull_number="DD-445",
-            unit_type=UnitType.DESTROYER,
-            task_force_assigned_to=None,
-            ship_class="Fletcher",
-            faction="USN",
-            position=Position(x=0.0, y=0.0),
-            destination=None,
-            max_speed=NauticalMiles(30.0),
-            cruise_speed=NauticalMiles(15.0),
-            current_speed=NauticalMiles(0.0),
-            max_health=100.0,
-            current_health=100.0,
-            max_fuel=1000.0,
-            current_fuel=1000.0,
-            crew=273,
-            tonnage=2100
-        )
-    
-    @pytest.fixture
-    def task_force_unit(self) -> Unit:
-        """Fixture providing a unit assigned to a task force"""
-        return Unit(
-            unit_id=uuid4(),
-            name="Task Force Ship",
-            hull_number="CA-68",
-            unit_type=UnitType.CRUISER,
-            task_force_assigned_to="TF-38",
-            ship_class="Baltimore",
-            faction="USN",
-            position=Position(x=10.0, y=10.0),
-            destination=None,
-            max_speed=NauticalMiles(25.0),
-            cruise_speed=NauticalMiles(15.0),
-            current_speed=NauticalMiles(0.0),
-            max_health=150.0,
-            current_health=150.0,
-            max_fuel=1200.0,
-            current_fuel=1200.0,
-            crew=1142,
-            tonnage=13600
-        )
 
     def test_unit_initialization(self, basic_unit: Unit) -> None:
         """Test that a unit is properly initialized with default values"""
@@ -66,7 +104,7 @@ class TestUnit:
         assert basic_unit.attributes.unit_type == UnitType.DESTROYER
         assert basic_unit.attributes.ship_class == "Fletcher"
         assert basic_unit.attributes.faction == "USN"
-        assert basic_unit.attributes.position == Position(0.0, 0.0)
+        assert basic_unit.attributes.position == _ORIGIN
         assert basic_unit.attributes.current_health == basic_unit.attributes.max_health
         assert basic_unit.attributes.current_fuel == basic_unit.attributes.max_fuel
         assert basic_unit.attributes.current_speed.value == 0.0
@@ -77,108 +115,126 @@ class TestUnit:
     def test_unit_with_task_force(self, task_force_unit: Unit) -> None:
         """Test that a unit can be initialized with a task force"""
         assert task_force_unit.attributes.task_force_assigned_to == "TF-38"
-        assert task_force_unit.attributes.position == Position(10.0, 10.0)
+        assert task_force_unit.attributes.position == _P10
         assert task_force_unit.attributes.ship_class == "Baltimore"
         assert task_force_unit.attributes.hull_number == "CA-68"
 
-    def test_unit_takes_damage(self, basic_unit: Unit) -> None:
-        """Test unit damage handling"""
-        initial_health = basic_unit.attributes.current_health
+    @pytest.mark.parametrize("unit_fixture", ["basic_unit", "task_force_unit"])
+    def test_unit_takes_damage(
+        self, unit_fixture: str, request: pytest.FixtureRequest
+    ) -> None:
+        """Test unit damage handling (holds for any unit, not just the basic one)"""
+        # Lazily bind by fixture name: the shared unit is only built when the
+        # case actually runs, and the Unit.__copy__ clone keeps it pristine.
+        unit = copy.copy(request.getfixturevalue(unit_fixture))
+        initial_health = unit.attributes.current_health
         damage_amount = 30.0
         
-        basic_unit.take_damage(damage_amount)
-        assert basic_unit.attributes.current_health == initial_health - damage_amount
-        assert basic_unit.is_alive
+        unit.take_damage(damage_amount)
+        assert unit.attributes.current_health == initial_health - damage_amount
+        assert unit.is_alive
 
         # Test that health cannot go below 0
-        basic_unit.take_damage(initial_health)
-        assert basic_unit.attributes.current_health == 0.0
-        assert not basic_unit.is_alive
-
-    def test_unit_fuel_consumption(self, basic_unit: Unit) -> None:
-        """Test unit fuel management"""
-        initial_fuel = basic_unit.attributes.current_fuel
+        unit.take_damage(initial_health)
+        assert unit.attributes.current_health == 0.0
+        assert not unit.is_alive
+
+    @pytest.mark.parametrize("unit_fixture", ["basic_unit", "task_force_unit"])
+    def test_unit_fuel_consumption(
+        self, unit_fixture: str, request: pytest.FixtureRequest
+    ) -> None:
+        """Test unit fuel management (holds for any unit, not just the basic one)"""
+        unit = copy.copy(request.getfixturevalue(unit_fixture))
+        initial_fuel = unit.attributes.current_fuel
         fuel_amount = 100.0
 
         # Test successful fuel consumption
-        assert basic_unit.consume_fuel(fuel_amount)
-        assert basic_unit.attributes.current_fuel == initial_fuel - fuel_amount
-        assert basic_unit.has_fuel
+        assert unit.consume_fuel(fuel_amount)
+        assert unit.attributes.current_fuel == initial_fuel - fuel_amount
+        assert unit.has_fuel
 
         # Test attempting to consume more fuel than available
-        remaining_fuel = basic_unit.attributes.current_fuel
-        assert not basic_unit.consume_fuel(remaining_fuel + 1.0)
-        assert basic_unit.attributes.current_fuel == remaining_fuel  # Fuel shouldn't change
+        remaining_fuel = unit.attributes.current_fuel
+        assert not unit.consume_fuel(remaining_fuel + 1.0)
+        assert unit.attributes.current_fuel == remaining_fuel  # Fuel shouldn't change
         
         # Test consuming exactly remaining fuel
-        assert basic_unit.consume_fuel(remaining_fuel)
-        assert basic_unit.attributes.current_fuel == 0.0
-        assert not basic_unit.has_fuel
+        assert unit.consume_fuel(remaining_fuel)
+        assert unit.attributes.current_fuel == 0.0
+        assert not unit.has_fuel
 
-    def test_unit_destination_setting(self, basic_unit: Unit) -> None:
+    def test_unit_destination_setting(self, mutable_unit: Unit) -> None:
         """Test setting unit destination"""
-        new_position = Position(100.0, 100.0)
+        new_position = _P100
         
-        basic_unit.set_destination(new_position)
-        assert basic_unit.attributes.destination == new_position
+        mutable_unit.set_destination(new_position)
+        assert mutable_unit.attributes.destination == new_position
         
         # Test updating destination
-        another_position = Position(200.0, 200.0)
-        basic_unit.set_destination(another_position)
-        assert basic_unit.attributes.destination == another_position
+        another_position = _P200
+        mutable_unit.set_destination(another_position)
+        assert mutable_unit.attributes.destination == another_position
 
-    def test_unit_speed_setting(self, basic_unit: Unit) -> None:
+    def test_unit_speed_setting(self, mutable_unit: Unit) -> None:
         """Test setting unit speed"""
         # Test initial speed
-        assert basic_unit.attributes.current_speed.value == 0.0
+        assert mutable_unit.attributes.current_speed.value == 0.0
         
         # Test setting valid speed
-        new_speed = NauticalMiles(20.0)
-        basic_unit.set_speed(new_speed)
-        assert basic_unit.attributes.current_speed == new_speed
+        new_speed = _NM_20
+        mutable_unit.set_speed(new_speed)
+        assert mutable_unit.attributes.current_speed == new_speed
         
         # Test setting negative speed
         with pytest.raises(ValueError):
-            basic_unit.set_speed(NauticalMiles(-5.0))
+            mutable_unit.set_speed(NauticalMiles(-5.0))
         
         # Test exceeding max speed
         with pytest.raises(ValueError):
-            basic_unit.set_speed(NauticalMiles(35.0))
+            mutable_unit.set_speed(NauticalMiles(35.0))
 
-    def test_task_force_assignment(self, basic_unit: Unit) -> None:
+    def test_task_force_assignment(self, mutable_unit: Unit) -> None:
         """Test assigning unit to task forces"""
         # Test assigning to a task force
         task_force = "TF-38"
-        basic_unit.assign_to_task_force(task_force)
-        assert basic_unit.attributes.task_force_assigned_to == task_force
+        mutable_unit.assign_to_task_force(task_force)
+        assert mutable_unit.attributes.task_force_assigned_to == task_force
         
         # Test reassigning to different task force
         new_task_force = "TF-58"
-        basic_unit.assign_to_task_force(new_task_force)
-        assert basic_unit.attributes.task_force_assigned_to == new_task_force
+        mutable_unit.assign_to_task_force(new_task_force)
+        assert mutable_unit.attributes.task_force_assigned_to == new_task_force
         
         # Test removing from task force
-        basic_unit.assign_to_task_force(None)
-        assert basic_unit.attributes.task_force_assigned_to is None
+        mutable_unit.assign_to_task_force(None)
+        assert mutable_unit.attributes.task_force_assigned_to is None
+
+    def test_get_unit_state(self, mutable_unit: Unit) -> None:
+        """Test that get_unit_state returns expected data without modifications.
+
+        Folded in from the old unittest-style test_units.py, which collected a
+        second TestUnit class against the same Unit surface.
+        """
+        state = mutable_unit.get_unit_state()
+        assert isinstance(state, dict)
+        assert 'unit_id' in state
+        assert 'current_health' not in state  # Ensure sensitive data is excluded
+        
+        # State reflects task force assignment
+        mutable_unit.assign_to_task_force('TaskForceA')
+        assert mutable_unit.get_unit_state()['task_force'] == 'TaskForceA'
 
-    def test_module_management(self, basic_unit: Unit) -> None:
+    def test_module_management(self, mutable_unit: Unit) -> None:
         """Test adding and retrieving modules"""
-        class TestModule(UnitModule):
-            def __init__(self) -> None:
-                self.initialized = False
-                
-            def initialize(self) -> None:
-                self.initialized = True
-
         # Test adding a module
-        test_module = TestModule()
-        basic_unit.add_module("test", test_module)
+        test_module = _ProbeModule()
+        mutable_unit.add_module("test", test_module)
         assert test_module.initialized
-        assert basic_unit.get_module("test") == test_module
+        assert mutable_unit.get_module("test") == test_module
 
         # Test adding duplicate module
         with pytest.raises(ValueError):
-            basic_unit.add_module("test", TestModule())
+            mutable_unit.add_module("test", _ProbeModule())
 
         # Test retrieving non-existent module
-        assert basic_unit.get_module("nonexistent") is None 
\ No newline at end of file
+        assert mutable_unit.get_module("nonexistent") is None 
\ No newline at end of file
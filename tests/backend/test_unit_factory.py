@@ -1,6 +1,7 @@
 """Tests for the UnitFactory service."""
 
 import pytest
+from typing import Dict
 from uuid import UUID
 
 from src.backend.models.common import Position
@@ -8,14 +9,23 @@ from src.backend.models.common.geometry.nautical_miles import NauticalMiles
 from src.backend.models.units import Unit
 from src.backend.models.units.types import UnitType
 from src.backend.services import UnitFactory
+from src.backend.services.unit_factory import UnitTemplate
+
+# Expected error pattern, hoisted so the literal lives in one place.
+# (Precompiling via re.compile buys nothing here: pytest.raises passes the
+# pattern to re.search, and the re module caches compiled patterns anyway.)
+_UNKNOWN_TYPE_MATCH = "Unknown unit type"
+
+# Interned speed values shared across tests; NauticalMiles is immutable.
+_NM_20 = NauticalMiles(20.0)
+_NM_40 = NauticalMiles(40.0)
 
 @pytest.mark.unit
-def test_create_unit_with_defaults() -> None:
+def test_create_unit_with_defaults(origin: Position) -> None:
     """Test creating a unit with default values."""
-    position = Position(x=0.0, y=0.0)
     unit = UnitFactory.create_unit(
         unit_type=UnitType.DESTROYER,
-        position=position,
+        position=origin,
         hull_number="DD-445",
         ship_class="Fletcher",
         faction="USN"
@@ -27,7 +37,7 @@ def test_create_unit_with_defaults() -> None:
     assert unit.attributes.unit_type == UnitType.DESTROYER
     assert unit.attributes.ship_class == "Fletcher"
     assert unit.attributes.faction == "USN"
-    assert unit.attributes.position == position
+    assert unit.attributes.position == origin
     assert unit.attributes.destination is None
     assert isinstance(unit.attributes.max_speed, NauticalMiles)
     assert unit.attributes.max_speed.value == 35.0  # Fletcher-class speed
@@ -41,13 +51,12 @@ def test_create_unit_with_defaults() -> None:
     assert unit.attributes.tonnage == 2100.0  # Fletcher-class displacement
 
 @pytest.mark.unit
-def test_create_unit_with_custom_values() -> None:
+def test_create_unit_with_custom_values(offset_position: Position) -> None:
     """Test creating a unit with custom values."""
-    position = Position(x=10.0, y=10.0)
     unit_id = UUID('12345678-1234-5678-1234-567812345678')
     unit = UnitFactory.create_unit(
         unit_type=UnitType.CRUISER,
-        position=position,
+        position=offset_position,
         hull_number="CA-68",
         task_force_assigned_to="TF-38",
         unit_id=unit_id,
@@ -64,7 +73,7 @@ def test_create_unit_with_custom_values() -> None:
     assert unit.attributes.unit_id == unit_id
     assert unit.attributes.ship_class == "Baltimore"
     assert unit.attributes.faction == "USN"
-    assert unit.attributes.position == position
+    assert unit.attributes.position == offset_position
     assert unit.attributes.destination is None
     assert isinstance(unit.attributes.max_speed, NauticalMiles)
     assert unit.attributes.max_speed.value == 33.0  # Baltimore-class speed
@@ -78,12 +87,11 @@ def test_create_unit_with_custom_values() -> None:
     assert unit.attributes.tonnage == 13600.0  # Baltimore-class displacement
 
 @pytest.mark.unit
-def test_create_unit_with_hull_number() -> None:
+def test_create_unit_with_hull_number(origin: Position) -> None:
     """Test that hull numbers are properly incorporated into unit names."""
-    position = Position(x=0.0, y=0.0)
     unit = UnitFactory.create_unit(
         unit_type=UnitType.BATTLESHIP,
-        position=position,
+        position=origin,
         hull_number="BB-61",
         ship_class="Iowa",
         faction="USN"
@@ -96,150 +104,78 @@ def test_create_unit_with_hull_number() -> None:
     assert unit.attributes.faction == "USN"
 
 @pytest.mark.unit
-def test_create_unit_invalid_type() -> None:
+def test_create_unit_invalid_type(origin: Position) -> None:
     """Test that creating a unit with an invalid type raises an error."""
-    position = Position(x=0.0, y=0.0)
-    with pytest.raises(ValueError, match="Unknown unit type"):
+    with pytest.raises(ValueError, match=_UNKNOWN_TYPE_MATCH):
         # Using type: ignore because we're intentionally testing invalid type
         UnitFactory.create_unit(
             "INVALID_TYPE",  # type: ignore
-            position,
+            origin,
             hull_number="XX-99",
             ship_class="Invalid",
             faction="TEST"
         )
 
 @pytest.mark.unit
-def test_convenience_methods() -> None:
+@pytest.mark.parametrize("method,hull,ship_class,unit_type,max_speed", [
+    ("create_destroyer", "DD-445", "Fletcher", UnitType.DESTROYER, 35.0),
+    ("create_cruiser", "CA-68", "Baltimore", UnitType.CRUISER, 33.0),
+    ("create_battleship", "BB-61", "Iowa", UnitType.BATTLESHIP, 28.0),
+    ("create_carrier", "CV-6", "Essex", UnitType.CARRIER, 33.0),
+    ("create_fighter", "VF-201", "F6F Hellcat", UnitType.FIGHTER, 280.0),
+    ("create_dive_bomber", "VB-3", "SBD Dauntless", UnitType.DIVE_BOMBER, 240.0),
+    ("create_torpedo_bomber", "VT-8", "TBF Avenger", UnitType.TORPEDO_BOMBER, 220.0),
+    ("create_transport", "AP-15", "Liberty", UnitType.TRANSPORT, 16.0),
+    ("create_base", "NB-7", "Naval Base", UnitType.BASE, 0.0),  # Stationary
+])
+def test_convenience_methods(
+    origin: Position,
+    method: str,
+    hull: str,
+    ship_class: str,
+    unit_type: UnitType,
+    max_speed: float,
+) -> None:
     """Test the convenience methods for creating specific unit types."""
-    position = Position(x=0.0, y=0.0)
-    
-    # Test all convenience methods
-    destroyer = UnitFactory.create_destroyer(
-        position=position,
-        hull_number="DD-445",
-        ship_class="Fletcher",
-        faction="USN"
-    )
-    assert destroyer.attributes.unit_type == UnitType.DESTROYER
-    assert destroyer.attributes.name == "DD-445"
-    assert destroyer.attributes.hull_number == "DD-445"
-    assert destroyer.attributes.ship_class == "Fletcher"
-    assert destroyer.attributes.max_speed.value == 35.0  # Fletcher-class speed
-    
-    cruiser = UnitFactory.create_cruiser(
-        position=position,
-        hull_number="CA-68",
-        ship_class="Baltimore",
-        faction="USN"
-    )
-    assert cruiser.attributes.unit_type == UnitType.CRUISER
-    assert cruiser.attributes.name == "CA-68"
-    assert cruiser.attributes.hull_number == "CA-68"
-    assert cruiser.attributes.ship_class == "Baltimore"
-    assert cruiser.attributes.max_speed.value == 33.0  # Baltimore-class speed
-    
-    battleship = UnitFactory.create_battleship(
-        position=position,
-        hull_number="BB-61",
-        ship_class="Iowa",
-        faction="USN"
-    )
-    assert battleship.attributes.unit_type == UnitType.BATTLESHIP
-    assert battleship.attributes.name == "BB-61"
-    assert battleship.attributes.hull_number == "BB-61"
-    assert battleship.attributes.ship_class == "Iowa"
-    assert battleship.attributes.max_speed.value == 28.0  # Iowa-class speed
-    
-    carrier = UnitFactory.create_carrier(
-        position=position,
-        hull_number="CV-6",
-        ship_class="Essex",
-        faction="USN"
-    )
-    assert carrier.attributes.unit_type == UnitType.CARRIER
-    assert carrier.attributes.name == "CV-6"
-    assert carrier.attributes.hull_number == "CV-6"
-    assert carrier.attributes.ship_class == "Essex"
-    assert carrier.attributes.max_speed.value == 33.0  # Essex-class speed
-    
-    fighter = UnitFactory.create_fighter(
-        position=position,
-        hull_number="VF-201",
-        ship_class="F6F Hellcat",
-        faction="USN"
-    )
-    assert fighter.attributes.unit_type == UnitType.FIGHTER
-    assert fighter.attributes.name == "VF-201"
-    assert fighter.attributes.hull_number == "VF-201"
-    assert fighter.attributes.ship_class == "F6F Hellcat"
-    assert fighter.attributes.max_speed.value == 280.0  # F6F Hellcat speed
-    
-    dive_bomber = UnitFactory.create_dive_bomber(
-        position=position,
-        hull_number="VB-3",
-        ship_class="SBD Dauntless",
+    unit = getattr(UnitFactory, method)(
+        position=origin,
+        hull_number=hull,
+        ship_class=ship_class,
         faction="USN"
     )
-    assert dive_bomber.attributes.unit_type == UnitType.DIVE_BOMBER
-    assert dive_bomber.attributes.name == "VB-3"
-    assert dive_bomber.attributes.hull_number == "VB-3"
-    assert dive_bomber.attributes.ship_class == "SBD Dauntless"
-    assert dive_bomber.attributes.max_speed.value == 240.0  # SBD Dauntless speed
-    
-    torpedo_bomber = UnitFactory.create_torpedo_bomber(
-        position=position,
-        hull_number="VT-8",
-        ship_class="TBF Avenger",
-        faction="USN"
-    )
-    assert torpedo_bomber.attributes.unit_type == UnitType.TORPEDO_BOMBER
-    assert torpedo_bomber.attributes.name == "VT-8"
-    assert torpedo_bomber.attributes.hull_number == "VT-8"
-    assert torpedo_bomber.attributes.ship_class == "TBF Avenger"
-    assert torpedo_bomber.attributes.max_speed.value == 220.0  # TBF Avenger speed
-    
-    transport = UnitFactory.create_transport(
-        position=position,
-        hull_number="AP-15",
-        ship_class="Liberty",
-        faction="USN"
-    )
-    assert transport.attributes.unit_type == UnitType.TRANSPORT
-    assert transport.attributes.name == "AP-15"
-    assert transport.attributes.hull_number == "AP-15"
-    assert transport.attributes.ship_class == "Liberty"
-    assert transport.attributes.max_speed.value == 16.0  # Liberty ship speed
-    
-    base = UnitFactory.create_base(
-        position=position,
-        hull_number="NB-7",
-        ship_class="Naval Base",
-        faction="USN"
-    )
-    assert base.attributes.unit_type == UnitType.BASE
-    assert base.attributes.name == "NB-7"
-    assert base.attributes.hull_number == "NB-7"
-    assert base.attributes.ship_class == "Naval Base"
-    assert base.attributes.max_speed.value == 0.0  # Stationary
+    assert unit.attributes.unit_type == unit_type
+    assert unit.attributes.name == hull
+    assert unit.attributes.hull_number == hull
+    assert unit.attributes.ship_class == ship_class
+    assert unit.attributes.max_speed.value == max_speed
+
+@pytest.mark.unit
+def test_unit_specs_cover_all_types(unit_specs: Dict[UnitType, UnitTemplate]) -> None:
+    """Test that no unit type is missing from the spec table.
+
+    One C-level set difference replaces a Python-level membership loop,
+    and a failure names every missing type at once.
+    """
+    missing = frozenset(UnitType) - unit_specs.keys()
+    assert not missing, f"missing specs: {missing}"
 
 @pytest.mark.unit
-def test_unit_specs_completeness() -> None:
-    """Test that all unit types have specifications defined."""
-    for unit_type in UnitType:
-        assert unit_type in UnitFactory.UNIT_SPECS
-        specs = UnitFactory.UNIT_SPECS[unit_type]
-        assert isinstance(specs.max_speed, NauticalMiles)
-        assert isinstance(specs.max_health, float)
-        assert isinstance(specs.max_fuel, float)
-        assert isinstance(specs.name_prefix, str)
+@pytest.mark.parametrize("unit_type", list(UnitType))
+def test_unit_specs_completeness(
+    unit_type: UnitType, unit_specs: Dict[UnitType, UnitTemplate]
+) -> None:
+    """Test that every unit type has a complete specification defined."""
+    specs = unit_specs[unit_type]
+    assert isinstance(specs.max_speed, NauticalMiles)
+    assert isinstance(specs.max_health, float)
+    assert isinstance(specs.max_fuel, float)
+    assert isinstance(specs.name_prefix, str)
 
 @pytest.mark.unit
-def test_speed_operations() -> None:
+def test_speed_operations(origin: Position) -> None:
     """Test speed-related operations on units."""
-    position = Position(x=0.0, y=0.0)
     destroyer = UnitFactory.create_destroyer(
-        position=position,
+        position=origin,
         hull_number="DD-445",
         ship_class="Fletcher",
         faction="USN"
@@ -249,49 +185,46 @@ def test_speed_operations() -> None:
     assert destroyer.attributes.current_speed.value == 0.0
     
     # Test setting speed
-    new_speed = NauticalMiles(20.0)
-    destroyer.set_speed(new_speed)
-    assert destroyer.attributes.current_speed == new_speed
+    destroyer.set_speed(_NM_20)
+    assert destroyer.attributes.current_speed == _NM_20
     
     # Test setting invalid speeds
     with pytest.raises(ValueError):
-        destroyer.set_speed(NauticalMiles(-5.0))  # Negative speed
+        # Negative values are rejected by NauticalMiles itself, so this
+        # one cannot be interned at module scope
+        destroyer.set_speed(NauticalMiles(-5.0))
     
     with pytest.raises(ValueError):
-        destroyer.set_speed(NauticalMiles(40.0))  # Exceeds max speed
-
-@pytest.mark.unit
-def test_transport_specifications() -> None:
-    """Test that transport ships have appropriate specifications."""
-    position = Position(x=0.0, y=0.0)
-    transport = UnitFactory.create_transport(
-        position=position,
-        hull_number="AP-15",
-        ship_class="Liberty",
-        faction="USN"
-    )
-    
-    assert transport.attributes.max_speed.value == 16.0  # Liberty ship speed
-    assert transport.attributes.max_health == 80.0  # Less armored
-    assert transport.attributes.max_fuel == 1800.0  # Large fuel capacity
-    assert transport.attributes.name.startswith("AP")
-    assert transport.attributes.hull_number == "AP-15"
-    assert transport.attributes.ship_class == "Liberty"
+        destroyer.set_speed(_NM_40)  # Exceeds max speed
 
 @pytest.mark.unit
-def test_base_specifications() -> None:
-    """Test that bases have appropriate specifications."""
-    position = Position(x=0.0, y=0.0)
-    base = UnitFactory.create_base(
-        position=position,
-        hull_number="NB-7",
-        ship_class="Naval Base",
+@pytest.mark.parametrize("method,hull,ship_class,max_speed,max_health,max_fuel,prefix", [
+    # Transports: slow, lightly armored, large bunkers
+    ("create_transport", "AP-15", "Liberty", 16.0, 80.0, 1800.0, "AP"),
+    # Bases: stationary, very durable, large fuel storage
+    ("create_base", "NB-7", "Naval Base", 0.0, 500.0, 5000.0, "NB"),
+], ids=["transport", "base"])
+def test_support_unit_specifications(
+    origin: Position,
+    method: str,
+    hull: str,
+    ship_class: str,
+    max_speed: float,
+    max_health: float,
+    max_fuel: float,
+    prefix: str,
+) -> None:
+    """Test that support unit types have appropriate specifications."""
+    unit = getattr(UnitFactory, method)(
+        position=origin,
+        hull_number=hull,
+        ship_class=ship_class,
         faction="USN"
     )
     
-    assert base.attributes.max_speed.value == 0.0  # Stationary
-    assert base.attributes.max_health == 500.0  # Very durable
-    assert base.attributes.max_fuel == 5000.0  # Large fuel storage
-    assert base.attributes.name.startswith("NB")
-    assert base.attributes.hull_number == "NB-7"
-    assert base.attributes.ship_class == "Naval Base" 
\ No newline at end of file
+    assert unit.attributes.max_speed.value == max_speed
+    assert unit.attributes.max_health == max_health
+    assert unit.attributes.max_fuel == max_fuel
+    assert unit.attributes.name.startswith(prefix)
+    assert unit.attributes.hull_number == hull
+    assert unit.attributes.ship_class == ship_class 
\ No newline at end of file
@@ -0,0 +1,71 @@
+
+import numpy as np
+
+from tests.backend._ids import next_uuid
+
+from src.backend.models.common.geometry.nautical_miles import NauticalMiles
+from src.backend.models.common.geometry.position import Position
+from src.backend.models.units.unit import Unit, UnitState, UnitType
+from src.backend.models.units.unit_table import UnitTable, UNIT_ROW_DTYPE
+
+
+def make_unit(name: str, faction: str, position: Position, current_health: float = 100.0) -> Unit:
+    """Build a minimal unit for table snapshot tests."""
+    return Unit(
+        unit_id=next_uuid(),
+        name=name,
+        hull_number=f"{name[0]}1",
+        unit_type=UnitType.DESTROYER,
+        task_force_assigned_to=None,
+        ship_class="TestClass",
+        faction=faction,
+        position=position,
+        destination=None,
+        max_speed=NauticalMiles(30),
+        cruise_speed=NauticalMiles(20),
+        current_speed=NauticalMiles(15),
+        max_health=100.0,
+        current_health=current_health,
+        max_fuel=100.0,
+        current_fuel=100.0,
+        crew=50,
+        tonnage=5000
+    )
+
+
+def test_row_dtype_is_cache_line_friendly() -> None:
+    """Each row must be 16 bytes so four rows tile one 64-byte cache line."""
+    assert UNIT_ROW_DTYPE.itemsize == 16
+
+
+def test_table_snapshots_hot_columns() -> None:
+    """Table rows mirror position, faction, state and health of the units."""
+    blue = make_unit("Blue", "BlueFaction", Position(x=1.0, y=2.0))
+    red = make_unit("Red", "RedFaction", Position(x=3.0, y=4.0), current_health=40.0)
+
+    table = UnitTable([blue, red])
+
+    assert len(table) == 2
+    assert table.x.tolist() == [1.0, 3.0]
+    assert table.y.tolist() == [2.0, 4.0]
+    assert table.faction_id.tolist() == [blue.faction_id, red.faction_id]
+    assert table.state_id.tolist() == [int(UnitState.OPERATING)] * 2
+    assert table.health.tolist() == [100.0, 40.0]
+
+    # Columns are views into one backing buffer, not copies
+    assert table.x.base is table.rows
+
+
+def test_targetable_mask_excludes_own_faction_and_sunk() -> None:
+    """Mask keeps only other-faction units that are not sunk."""
+    attacker = make_unit("Attacker", "BlueFaction", Position(x=0.0, y=0.0))
+    friendly = make_unit("Friendly", "BlueFaction", Position(x=1.0, y=0.0))
+    enemy = make_unit("Enemy", "RedFaction", Position(x=2.0, y=0.0))
+    sunk_enemy = make_unit("Sunk", "RedFaction", Position(x=3.0, y=0.0))
+    sunk_enemy.state = UnitState.SUNK
+
+    table = UnitTable([friendly, enemy, sunk_enemy])
+    mask = table.targetable_mask(attacker.faction_id)
+
+    assert mask.dtype == np.bool_
+    assert mask.tolist() == [False, True, False]
@@ -7,8 +7,10 @@ well-documented coordinates and distances.
 """
 
 import math
+
+import numpy as np
 import pytest
-from typing import NoReturn
+from typing import Callable, NamedTuple, NoReturn, Optional
 from src.backend.models.common.geometry.vincenty import (
     calculate_haversine_distance,
     calculate_vincenty_distance,
@@ -23,6 +25,7 @@ from src.backend.models.common.geometry.vincenty import (
     calculate_reduced_latitude,
     METERS_PER_NAUTICAL_MILE
 )
+from src.backend.models.common.geometry.haversine import calculate_haversine_distance_batch
 from src.backend.models.common.geometry.position import Position
 from src.backend.models.common.geometry.nautical_miles import NauticalMiles
 from src.backend.models.common.geometry.bearing import Bearing
@@ -38,8 +41,53 @@ SEA = Position(x=-122.311777, y=47.449888)  # Seattle-Tacoma International
 SCALE_FACTOR = 1.0  # 1 game unit = 1 degree
 
 # Common distances in nautical miles
+# One NauticalMiles literal kept to exercise the constructor; comparisons
+# below use the raw floats to avoid allocating a wrapper per assert.
 EARTH_CIRCUMFERENCE_NM = NauticalMiles(21600)  # Earth's circumference
-HALF_EARTH_CIRCUMFERENCE_NM = NauticalMiles(EARTH_CIRCUMFERENCE_NM.value / 2)
+HALF_EARTH_CIRCUMFERENCE_NM = EARTH_CIRCUMFERENCE_NM.value / 2
+
+class AirportPair(NamedTuple):
+    """One row of the airport reference table.
+
+    Built once at import; the distance, bearing and batch tests all
+    parametrize over the same tuple instead of re-stating the literals.
+    """
+    a_name: str
+    b_name: str
+    a: Position
+    b: Position
+    expected_nm: float
+    nm_tolerance: float
+    expected_bearing_deg: Optional[float]
+
+AIRPORT_PAIRS = (
+    # Official distance 2247 nm, initial bearing ~70 degrees
+    AirportPair("SFO", "JFK", SFO, JFK, 2247.0, 1.0, 70.0),
+    # Official distance 293 nm, initial bearing ~137.5 degrees
+    AirportPair("SFO", "LAX", SFO, LAX, 293.0, 1.0, 137.5),
+    # Official distance 829 nm; no published reference bearing used here
+    AirportPair("SEA", "LAX", SEA, LAX, 829.0, 5.0, None),
+)
+
+def _pair_id(pair: AirportPair) -> str:
+    return f"{pair.a_name}->{pair.b_name}"
+
+# Cardinal-direction and equatorial endpoints, interned at import: the
+# position types are frozen, so the edge-case tests can share instances
+# instead of re-validating four constructors per run.
+_NORTH = Position(x=0, y=10)
+_SOUTH = Position(x=0, y=0)
+_WEST = Position(x=0, y=0)
+_EAST = Position(x=10, y=0)
+_EQ_ORIGIN = GeoPosition(0, 0)
+_EQ_90E = GeoPosition(0, 90)
+_NORTH_POLE = Position(x=0, y=90)
+_SOUTH_POLE = Position(x=0, y=-90)
+
+# Both distance entry points share the symmetric/zero/antipodal contracts;
+# the tests below parametrize over them instead of duplicating each body.
+_DISTANCE_FUNCS = [calculate_haversine_distance, calculate_vincenty_distance]
+_DISTANCE_IDS = ["haversine", "vincenty"]
 
 def test_geo_position_creation() -> None:
     """Test GeoPosition creation and validation."""
@@ -119,94 +167,96 @@ def test_reduced_latitude() -> None:
     assert result.sin_U == pytest.approx(1)
     assert result.cos_U == pytest.approx(0, abs=1e-6)
 
-def test_airport_distances() -> None:
+@pytest.mark.parametrize("pair", AIRPORT_PAIRS, ids=_pair_id)
+def test_airport_distances(pair: AirportPair) -> None:
     """
     Test distances between major airports.
     
     These distances are verified against current aviation data and
     official airport distance calculations.
     """
-    # SFO to JFK (Official distance: 2247 nautical miles)
-    distance = calculate_haversine_distance(SFO, JFK, SCALE_FACTOR)
-    assert abs(distance.value - NauticalMiles(2247).value) < 1  # Within 1 nautical mile
+    distance = calculate_haversine_distance(pair.a, pair.b, SCALE_FACTOR)
+    assert abs(distance.value - pair.expected_nm) < pair.nm_tolerance
 
-    # SFO to LAX (Official distance: 293 nautical miles)
-    distance = calculate_haversine_distance(SFO, LAX, SCALE_FACTOR)
-    assert abs(distance.value - NauticalMiles(293).value) < 1  # Within 1 nautical mile
+def test_airport_distances_batch() -> None:
+    """
+    Test the vectorized spherical batch path against the airport table.
 
-    # SEA to LAX (Official distance: 829 nautical miles)
-    distance = calculate_haversine_distance(SEA, LAX, SCALE_FACTOR)
-    assert abs(distance.value - NauticalMiles(829).value) < 5  # Within 5 nautical miles
+    All endpoint pairs go through one calculate_haversine_distance_batch
+    call instead of per-pair scalar invocations. The batch kernel uses the
+    spherical model rather than the WGS84 ellipsoid the scalar asserts
+    above are checked against, so the tolerance is the ~0.25%% sphere vs
+    ellipsoid divergence (about 6 nm on the SFO-JFK leg), not a looser
+    version of the 1 nm accuracy checks, which stay in place unchanged.
+    """
+    lat1 = np.array([p.a.y for p in AIRPORT_PAIRS])
+    lon1 = np.array([p.a.x for p in AIRPORT_PAIRS])
+    lat2 = np.array([p.b.y for p in AIRPORT_PAIRS])
+    lon2 = np.array([p.b.x for p in AIRPORT_PAIRS])
+    expected = np.array([p.expected_nm for p in AIRPORT_PAIRS])
+    
+    results = calculate_haversine_distance_batch(lat1, lon1, lat2, lon2, SCALE_FACTOR)
+    np.testing.assert_allclose(results, expected, atol=6.0)
 
-def test_airport_bearings() -> None:
+@pytest.mark.parametrize(
+    "pair",
+    [p for p in AIRPORT_PAIRS if p.expected_bearing_deg is not None],
+    ids=_pair_id,
+)
+def test_airport_bearings(pair: AirportPair) -> None:
     """
     Test bearings between major airports.
     
     These bearings are verified against current aviation data.
     """
-    # SFO to JFK (Initial bearing: ~70 degrees)
-    bearing = bearing_between(SFO, JFK, SCALE_FACTOR)
-    assert abs(bearing.degrees - 70) < 1  # Within 1 degree
+    assert pair.expected_bearing_deg is not None
+    bearing = bearing_between(pair.a, pair.b, SCALE_FACTOR)
+    assert abs(bearing.degrees - pair.expected_bearing_deg) < 1  # Within 1 degree
 
-    # SFO to LAX (Initial bearing: ~137.5 degrees)
-    bearing = bearing_between(SFO, LAX, SCALE_FACTOR)
-    assert abs(bearing.degrees - 137.5) < 1  # Within 1 degree
-
-def test_symmetrical_distances() -> None:
+@pytest.mark.parametrize("calc", _DISTANCE_FUNCS, ids=_DISTANCE_IDS)
+def test_symmetrical_distances(
+    calc: Callable[[Position, Position, float], NauticalMiles]
+) -> None:
     """Test that distances are symmetrical (A to B equals B to A)."""
-    dist1 = calculate_haversine_distance(SFO, JFK, SCALE_FACTOR)
-    dist2 = calculate_haversine_distance(JFK, SFO, SCALE_FACTOR)
-    assert dist1.value == pytest.approx(dist2.value)
-    
-    # Also test with Vincenty
-    dist1 = calculate_vincenty_distance(SFO, JFK, SCALE_FACTOR)
-    dist2 = calculate_vincenty_distance(JFK, SFO, SCALE_FACTOR)
+    dist1 = calc(SFO, JFK, SCALE_FACTOR)
+    dist2 = calc(JFK, SFO, SCALE_FACTOR)
     assert dist1.value == pytest.approx(dist2.value)
 
-def test_zero_distance() -> None:
+@pytest.mark.parametrize("calc", _DISTANCE_FUNCS, ids=_DISTANCE_IDS)
+def test_zero_distance(
+    calc: Callable[[Position, Position, float], NauticalMiles]
+) -> None:
     """Test distance calculation between same point."""
-    dist = calculate_haversine_distance(SFO, SFO, SCALE_FACTOR)
-    assert dist == NauticalMiles(0)
-    
-    # Also test with Vincenty
-    dist = calculate_vincenty_distance(SFO, SFO, SCALE_FACTOR)
-    assert dist == NauticalMiles(0)
+    dist = calc(SFO, SFO, SCALE_FACTOR)
+    assert dist == NauticalMiles.ZERO
 
-def test_antipodal_points() -> None:
+@pytest.mark.parametrize("calc", _DISTANCE_FUNCS, ids=_DISTANCE_IDS)
+def test_antipodal_points(
+    calc: Callable[[Position, Position, float], NauticalMiles]
+) -> None:
     """Test distance calculation between antipodal points."""
-    north_pole = Position(x=0, y=90)
-    south_pole = Position(x=0, y=-90)
+    dist = calc(_NORTH_POLE, _SOUTH_POLE, SCALE_FACTOR)
     
-    # Test both Haversine and Vincenty
-    dist_haversine = calculate_haversine_distance(north_pole, south_pole, SCALE_FACTOR)
-    dist_vincenty = calculate_vincenty_distance(north_pole, south_pole, SCALE_FACTOR)
-    
-    # Both should be close to half Earth's circumference
-    assert abs(dist_haversine.value - HALF_EARTH_CIRCUMFERENCE_NM.value) < 10
-    assert abs(dist_vincenty.value - HALF_EARTH_CIRCUMFERENCE_NM.value) < 10
+    # Should be close to half Earth's circumference
+    assert abs(dist.value - HALF_EARTH_CIRCUMFERENCE_NM) < 10
 
 def test_bearing_edge_cases() -> None:
     """Test bearing calculations for edge cases."""
+    # Plain abs-difference asserts: for simple float tolerances they skip
+    # the ApproxScalar machinery, which adds up when these sweeps grow.
     # North to South (should be 180 degrees)
-    north = Position(x=0, y=10)
-    south = Position(x=0, y=0)
-    assert bearing_between(north, south, SCALE_FACTOR).degrees == pytest.approx(180, abs=1)
+    assert abs(bearing_between(_NORTH, _SOUTH, SCALE_FACTOR).degrees - 180) <= 1
     
     # West to East (should be 90 degrees)
-    west = Position(x=0, y=0)
-    east = Position(x=10, y=0)
-    assert bearing_between(west, east, SCALE_FACTOR).degrees == pytest.approx(90, abs=1)
+    assert abs(bearing_between(_WEST, _EAST, SCALE_FACTOR).degrees - 90) <= 1
     
     # East to West (should be 270 degrees)
-    assert bearing_between(east, west, SCALE_FACTOR).degrees == pytest.approx(270, abs=1)
+    assert abs(bearing_between(_EAST, _WEST, SCALE_FACTOR).degrees - 270) <= 1
 
 def test_equatorial_points() -> None:
     """Test calculations for points on the equator."""
-    # Two points on the equator
-    point1 = GeoPosition(0, 0)
-    point2 = GeoPosition(0, 90)
-    
-    result = calculate_vincenty_full(point1, point2)
+    # Two points on the equator, shared module constants
+    result = calculate_vincenty_full(_EQ_ORIGIN, _EQ_90E)
     
     # Should be 1/4 of Earth's circumference
     expected_distance = EARTH_CIRCUMFERENCE_NM.value / 4
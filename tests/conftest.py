@@ -1,48 +1,89 @@
 """
 Pytest configuration and shared fixtures.
 """
-import sys
-import os
-from typing import Dict, Generator
+from datetime import datetime, timezone
+from typing import Dict
 import pytest
 from flask import Flask
 from flask.testing import FlaskClient
-from src.backend.app import app as flask_app
-
-def pytest_configure(config):
-    try:
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-        src_path = os.path.join(project_root, 'src')
-        if src_path not in sys.path:
-            sys.path.insert(0, src_path)
-        print(f'Added to sys.path: {src_path}')  # Debug print
-    except Exception as e:
-        print(f'Error adding path: {e}')
-
-@pytest.fixture
+from src.backend.models.common.time import GameTime
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_detection_kernel() -> None:
+    """Load the compiled detection kernel once at session start.
+
+    The kernel carries an explicit signature and cache=True, so this is a
+    disk-cache load (or a one-time compile on a fresh machine) and keeps JIT
+    latency out of individual timing-sensitive tests.
+    """
+    import numpy as np
+    from src.backend.models.common.geometry._detection_kernel import haversine_nm
+    from src.backend.models.common.geometry.haversine import (
+        _haversine_nm,
+        _haversine_nm_batch,
+    )
+    if haversine_nm is not None:
+        haversine_nm(0.0, 0.0, np.zeros(1), np.zeros(1))
+    if _haversine_nm is not None:
+        _haversine_nm(0.0, 0.0, 1.0, 1.0)
+    if _haversine_nm_batch is not None:
+        _haversine_nm_batch(np.zeros(1), np.zeros(1), np.ones(1), np.ones(1), 1.0)
+    from src.backend.models.units.modules import _movement_kernels
+    # njit is a guarded numba import, not a declared export of the kernels
+    # module, so probe it with getattr rather than a direct (re-exported)
+    # attribute access that strict mypy rejects.
+    if getattr(_movement_kernels, "njit", None) is not None:
+        _movement_kernels.bearing_degrees(1.0, 1.0)
+        _movement_kernels.bearing_components(1.0, 1.0)
+        _movement_kernels.movement_vector(0.7, 0.7, 1.0, 0.0)
+        one = np.ones(1)
+        _movement_kernels.advance_arrays(  # type: ignore[no-untyped-call]
+            np.zeros(1), np.zeros(1), one, one, one * 0.7, one * 0.7,
+            one * 0.1, 0.1, np.zeros(1, dtype=np.bool_),
+        )
+
+@pytest.fixture(scope="session")
+def valid_game_dt() -> datetime:
+    """A datetime safely inside the valid game bounds, built once per session."""
+    return datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+@pytest.fixture(scope="session")
+def valid_game_time(valid_game_dt: datetime) -> GameTime:
+    """Session-shared GameTime; safe to share because GameTime is immutable."""
+    return GameTime.from_datetime(valid_game_dt)
+
+@pytest.fixture(scope="session")
 def app() -> Flask:
-    """Create a Flask application for testing."""
+    """Create a Flask application for testing.
+
+    Session-scoped: the module-level app is shared anyway, and the TESTING
+    flag only needs to be set once. src.backend.app is imported here rather
+    than at module level so sessions that never touch a route fixture skip
+    the blueprint/template registration cost entirely.
+    """
+    from src.backend.app import app as flask_app
     flask_app.config.update({
         "TESTING": True,
+        "TEMPLATES_AUTO_RELOAD": False,
     })
     return flask_app
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(app: Flask) -> FlaskClient:
-    """Create a test client for the Flask application."""
+    """Create a test client for the Flask application, shared per session."""
     return app.test_client()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_position() -> Dict[str, int]:
-    """Create a sample Position for testing."""
+    """Create a sample Position for testing (session-shared, read-only)."""
     return {"x": 0, "y": 0}
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_player() -> Dict[str, str]:
-    """Create a sample PlayerState for testing."""
+    """Create a sample PlayerState for testing (session-shared, read-only)."""
     return {"id": "test_player"}
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_game(sample_player: Dict[str, str]) -> Dict[str, object]:
     """Create a sample GameState for testing."""
     return {